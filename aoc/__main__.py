@@ -0,0 +1,317 @@
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import time
+
+from aoc import (
+    backend,
+    batch,
+    bench,
+    cache,
+    generate,
+    memory,
+    profiling,
+    runner,
+    service,
+    verify,
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run days in a single process")
+    run.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    run.add_argument("-p", "--part", type=int, nargs="+", choices=(1, 2), default=[1, 2])
+    run.add_argument("-s", "--sample", action="store_true", help="use sample.txt")
+    run.add_argument("-v", "--verbose", action="store_true", help="show solver output")
+    run.add_argument("--scale", type=int, help="use a generated input of this scale")
+    run.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    run.add_argument("--no-cache", action="store_true", help="always parse inputs")
+    run.add_argument("--budgets", type=Path, default=memory.BUDGETS, help="per-day MiB")
+    run.add_argument("--max-rss", type=float, help="RSS growth budget in MiB for every day")
+    run.add_argument("--backend", choices=backend.BACKENDS, help="array backend")
+
+    gen = commands.add_parser("generate", help="write scaled synthetic inputs")
+    gen.add_argument("days", nargs="*", type=int, help="days to generate (default: all)")
+    gen.add_argument("--scale", type=int, nargs="+", default=list(generate.SCALES))
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("-o", "--output", type=Path, help="output file (single day/scale)")
+
+    bm = commands.add_parser("bench", help="benchmark scaling against a baseline")
+    bm.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    bm.add_argument("-p", "--part", type=int, nargs="+", choices=(1, 2), default=[1, 2])
+    bm.add_argument("--scale", type=int, nargs="+", default=list(bench.SCALES))
+    bm.add_argument("--seed", type=int, default=0)
+    bm.add_argument("--repeat", type=int, default=3, help="runs per size, best is kept")
+    bm.add_argument("--baseline", type=Path, default=bench.BASELINE)
+    bm.add_argument("--threshold", type=float, default=bench.THRESHOLD)
+    bm.add_argument("--save", action="store_true", help="store results as baseline")
+    bm.add_argument("--no-verify", action="store_true", help="skip answer checks")
+
+    bt = commands.add_parser("batch", help="solve a directory of inputs in parallel")
+    bt.add_argument("day", type=int)
+    bt.add_argument("directory", type=Path)
+    bt.add_argument("-p", "--part", type=int, nargs="+", choices=(1, 2), default=[1, 2])
+    bt.add_argument("-j", "--workers", type=int, help="processes (default: all cores)")
+    bt.add_argument("--pattern", default="*.txt", help="glob for input files")
+    bt.add_argument("--no-cache", action="store_true", help="always solve")
+    bt.add_argument("--budgets", type=Path, default=memory.BUDGETS, help="per-day MiB")
+    bt.add_argument("--max-rss", type=float, help="RSS growth budget in MiB")
+
+    pf = commands.add_parser("profile", help="profile one day and part")
+    pf.add_argument("day", type=int)
+    pf.add_argument("part", type=int, choices=(1, 2))
+    pf.add_argument("-s", "--sample", action="store_true", help="use sample.txt")
+    pf.add_argument("--scale", type=int, help="use a generated input of this scale")
+    pf.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    pf.add_argument("--top", type=int, default=20, help="rows per table")
+    pf.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    pf.add_argument("--stacks", type=Path, help="write sampled collapsed stacks")
+    pf.add_argument("--interval", type=float, default=0.001, help="sampling period (s)")
+
+    df = commands.add_parser("diff", help="compare fast paths on one input")
+    df.add_argument("days", nargs="*", type=int, help="days to check (default: all)")
+    df.add_argument("-p", "--part", type=int, nargs="+", choices=(1, 2), default=[1, 2])
+    df.add_argument("-s", "--sample", action="store_true", help="use sample.txt")
+    df.add_argument("--scale", type=int, help="use a generated input of this scale")
+    df.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+
+    vf = commands.add_parser("verify", help="check stored answers and fast paths")
+    vf.add_argument("days", nargs="*", type=int, help="days to verify (default: all)")
+    vf.add_argument("-p", "--part", type=int, nargs="+", choices=(1, 2), default=[1, 2])
+    vf.add_argument("--kind", nargs="+", choices=verify.KINDS, default=list(verify.KINDS))
+    vf.add_argument("--seeds", type=int, default=3, help="generated inputs to cross-check")
+    vf.add_argument("--scale", type=int, default=1, help="scale of generated inputs")
+    vf.add_argument("--record", action="store_true", help="store answers as expected")
+    vf.add_argument("--expected", type=Path, default=verify.EXPECTED)
+
+    sv = commands.add_parser("serve", help="serve solves over a local socket")
+    sv.add_argument("--socket", type=Path, help="unix socket (default: localhost tcp)")
+    sv.add_argument("--port", type=int, default=service.PORT)
+    sv.add_argument("-j", "--workers", type=int, help="processes (default: all cores)")
+    sv.add_argument("--no-cache", action="store_true", help="always solve")
+
+    rq = commands.add_parser("request", help="send one request to a running service")
+    rq.add_argument("day", type=int, nargs="?")
+    rq.add_argument("part", type=int, nargs="?", choices=(1, 2))
+    rq.add_argument("input", type=Path, nargs="?")
+    rq.add_argument("--stats", action="store_true", help="show service statistics")
+    rq.add_argument("--socket", type=Path)
+    rq.add_argument("--port", type=int, default=service.PORT)
+
+    return parser.parse_args(argv)
+
+
+def input_path(args: argparse.Namespace, day: int) -> Path:
+    if args.scale is None:
+        return runner.input_path(day, args.sample)
+    return generate.generated_input(day, args.scale, args.seed)
+
+
+def memory_budget(args: argparse.Namespace, day: int) -> int | None:
+    if args.max_rss is not None:
+        return int(args.max_rss * memory.MIB)
+    return memory.budget_for(memory.load_budgets(args.budgets), runner.day_name(day))
+
+
+def check_budgets(results: list[runner.Result]) -> None:
+    over = [r for r in results if r.over_budget]
+    if over:
+        raise SystemExit(f"{len(over)} part(s) exceeded their memory budget")
+
+
+def run(args: argparse.Namespace) -> None:
+    days = args.days or runner.available_days()
+    if args.no_cache:
+        cache.ENABLED = False
+    if args.backend:
+        backend.select(args.backend)
+    results = []
+
+    print(runner.format_header())
+    for day in days:
+        path = input_path(args, day)
+        budget = memory_budget(args, day)
+        for part in args.part:
+            result = runner.run_part(day, part, path, not args.verbose, budget)
+            print(runner.format_result(result), flush=True)
+            results.append(result)
+    print(runner.format_total(results))
+    check_budgets(results)
+
+
+def write_inputs(args: argparse.Namespace) -> None:
+    days = args.days or runner.available_days()
+    if args.output and len(days) * len(args.scale) > 1:
+        raise SystemExit("--output needs a single day and scale")
+
+    for day in days:
+        for scale in args.scale:
+            path = generate.write_input(day, scale, args.seed, args.output)
+            print(path)
+
+
+def run_benchmarks(args: argparse.Namespace) -> None:
+    days = args.days or runner.available_days()
+    baseline = bench.load_baseline(args.baseline)
+
+    # timings of wrong answers are worthless
+    if not args.no_verify:
+        failures = verify.gate(days, args.part)
+        if failures:
+            for failure in failures:
+                print(failure)
+            raise SystemExit("verification failed, not benchmarking")
+
+    benchmarks = []
+    for day in days:
+        for part in args.part:
+            result = bench.benchmark(day, part, args.scale, args.repeat, args.seed)
+            print(bench.format_benchmark(result), flush=True)
+            benchmarks.append(result)
+
+    if args.save:
+        bench.save_baseline(benchmarks, args.baseline)
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    regressions = bench.compare(benchmarks, baseline, args.threshold)
+    if regressions:
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        raise SystemExit(f"{len(regressions)} benchmark(s) regressed")
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    if args.no_cache:
+        cache.ENABLED = False
+    paths = batch.input_files(args.directory, args.pattern)
+    if not paths:
+        raise SystemExit(f"no inputs matching {args.pattern} in {args.directory}")
+
+    results = []
+    start = time.perf_counter()
+    print(batch.format_batch_header())
+    budget = memory_budget(args, args.day)
+    for result in batch.solve(args.day, args.part, paths, args.workers, budget):
+        print(batch.format_batch_result(result), flush=True)
+        results.append(result)
+    elapsed = time.perf_counter() - start
+    print(batch.format_summary(batch.summarize(results, elapsed)))
+    check_budgets([r.result for r in results])
+
+
+def run_profile(args: argparse.Namespace) -> None:
+    call = runner.solver_call(args.day, args.part, input_path(args, args.day))
+    result = profiling.profile(
+        call, args.top, not args.no_memory, args.stacks is not None, args.interval
+    )
+
+    print(f"answer: {result.answer}\n")
+    print(profiling.format_hotspots(result.hotspots))
+    if not args.no_memory:
+        print()
+        print(
+            profiling.format_allocations(
+                result.peak, result.allocations, result.snapshot, result.final
+            )
+        )
+    if args.stacks:
+        profiling.write_collapsed(result.stacks, args.stacks)
+        print(f"\n{sum(result.stacks.values())} samples written to {args.stacks}")
+
+
+def compare_fast_paths(args: argparse.Namespace) -> None:
+    comparisons = []
+    for day in args.days or runner.available_days():
+        path = input_path(args, day)
+        for part in args.part:
+            if verify.has_fast_path(day, part):
+                comparison = verify.cross_check(day, part, path)
+                print(verify.format_comparison(comparison), flush=True)
+                comparisons.append(comparison)
+
+    mismatches = [c for c in comparisons if not c.ok]
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} part(s) differ between implementations")
+
+
+def run_verify(args: argparse.Namespace) -> None:
+    days = args.days or runner.available_days()
+    kinds = tuple(args.kind)
+    expected = verify.load_expected(args.expected)
+
+    if args.record:
+        for day in days:
+            for result in verify.record(day, args.part, expected, kinds):
+                print(runner.format_result(result), flush=True)
+        verify.save_expected(expected, args.expected)
+        print(f"answers saved to {args.expected}")
+        return
+
+    failures = 0
+    for day in days:
+        for check in verify.check_answers(day, args.part, expected, kinds):
+            print(verify.format_check(check), flush=True)
+            failures += not check.ok
+        for part in args.part:
+            if not verify.has_fast_path(day, part):
+                continue
+            seeds = range(args.seeds)
+            for comparison in verify.cross_check_generated(day, part, seeds, args.scale):
+                print(verify.format_comparison(comparison), flush=True)
+                failures += not comparison.ok
+
+    if failures:
+        raise SystemExit(f"{failures} check(s) failed")
+
+
+def run_service(args: argparse.Namespace) -> None:
+    if args.no_cache:
+        cache.ENABLED = False
+    where = args.socket or f"{service.HOST}:{args.port}"
+    print(f"serving on {where}", flush=True)
+    try:
+        asyncio.run(service.serve(args.socket, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+def send_request(args: argparse.Namespace) -> None:
+    if args.stats:
+        message = {"op": "stats"}
+    elif args.input is None:
+        raise SystemExit("request needs a day, part and input file, or --stats")
+    else:
+        message = {"day": args.day, "part": args.part, "input": args.input.read_text()}
+    response = asyncio.run(service.request(message, args.socket, args.port))
+    print(json.dumps(response, indent=2))
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.command == "run":
+        run(args)
+    elif args.command == "generate":
+        write_inputs(args)
+    elif args.command == "bench":
+        run_benchmarks(args)
+    elif args.command == "batch":
+        run_batch(args)
+    elif args.command == "profile":
+        run_profile(args)
+    elif args.command == "diff":
+        compare_fast_paths(args)
+    elif args.command == "verify":
+        run_verify(args)
+    elif args.command == "serve":
+        run_service(args)
+    elif args.command == "request":
+        send_request(args)
+
+
+if __name__ == "__main__":
+    main()
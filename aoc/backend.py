@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+import os
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:  # every kernel has a pure-Python path
+    np = None
+
+BACKENDS = ("python", "numpy")
+
+# read at call time, so solvers follow select() and using()
+NUMPY = np is not None and os.environ.get("AOC_BACKEND", "numpy") != "python"
+
+
+def available() -> list[str]:
+    return list(BACKENDS) if np is not None else ["python"]
+
+
+def current() -> str:
+    return "numpy" if NUMPY else "python"
+
+
+def select(name: str) -> None:
+    global NUMPY
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend {name}")
+    if name == "numpy" and np is None:
+        raise RuntimeError("numpy is not installed")
+    NUMPY = name == "numpy"
+
+
+@contextmanager
+def using(name: str) -> Iterator[None]:
+    previous = current()
+    select(name)
+    try:
+        yield
+    finally:
+        select(previous)
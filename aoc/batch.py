@@ -0,0 +1,87 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import time
+from typing import Iterable, Iterator
+
+from aoc import cache, runner
+
+
+@dataclass
+class BatchResult:
+    path: Path
+    result: runner.Result
+    latency: float  # from batch start until the result came back
+
+
+@dataclass
+class Summary:
+    count: int
+    elapsed: float
+    latencies: list[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def configure_worker(cache_enabled: bool) -> None:
+    cache.ENABLED = cache_enabled
+
+
+def input_files(directory: Path, pattern: str = "*.txt") -> list[Path]:
+    return sorted(p for p in directory.glob(pattern) if p.is_file())
+
+
+def solve(
+    day: int,
+    parts: list[int],
+    paths: Iterable[Path],
+    workers: int | None = None,
+    budget: int | None = None,
+) -> Iterator[BatchResult]:
+    # results are yielded as soon as each input finishes, not in input order
+    workers = workers or os.cpu_count()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        workers, initializer=configure_worker, initargs=(cache.ENABLED,)
+    ) as pool:
+        futures = {
+            pool.submit(runner.run_part, day, part, path, True, budget): path
+            for path in paths
+            for part in parts
+        }
+        for future in as_completed(futures):
+            latency = time.perf_counter() - start
+            yield BatchResult(futures[future], future.result(), latency)
+
+
+def summarize(results: list[BatchResult], elapsed: float) -> Summary:
+    return Summary(len(results), elapsed, [r.result.wall for r in results])
+
+
+def format_batch_result(r: BatchResult) -> str:
+    answer = r.result.error or r.result.answer
+    times = f"{runner.ms(r.result.wall)} {runner.ms(r.latency)}"
+    return f"{r.path.name:>24} {r.result.part:>4} {times}  {answer}"
+
+
+def format_batch_header() -> str:
+    return f"{'input':>24} {'part':>4} {'solve ms':>10} {'done at ms':>10}  answer"
+
+
+def format_summary(s: Summary) -> str:
+    p50 = runner.ms(percentile(s.latencies, 0.5)).strip()
+    p99 = runner.ms(percentile(s.latencies, 0.99)).strip()
+    return (
+        f"{s.count} solves in {s.elapsed:.2f} s, {s.throughput:.1f}/s, "
+        f"solve p50 {p50} ms, p99 {p99} ms"
+    )
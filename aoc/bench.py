@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+import json
+import math
+from pathlib import Path
+
+from aoc import cache, generate, runner
+
+BASELINE = runner.ROOT / "benchmarks.json"
+SCALES = (1, 2, 4)
+THRESHOLD = 0.25
+
+# differences below this are timer noise, whatever the ratio
+MIN_DELTA = 0.002
+
+
+@dataclass
+class Benchmark:
+    day: int
+    part: int
+    times: dict[int, float] = field(default_factory=dict)
+    error: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{runner.day_name(self.day)}/{self.part}"
+
+    @property
+    def exponent(self) -> float:
+        return fit_exponent(self.times)
+
+    def to_json(self) -> dict:
+        return {
+            "times": {str(scale): t for scale, t in self.times.items()},
+            "exponent": round(self.exponent, 2),
+        }
+
+
+@dataclass
+class Regression:
+    key: str
+    scale: int
+    old: float
+    new: float
+
+    @property
+    def ratio(self) -> float:
+        return self.new / self.old
+
+    def __str__(self) -> str:
+        old, new = runner.ms(self.old).strip(), runner.ms(self.new).strip()
+        return f"{self.key} x{self.scale}: {old} ms -> {new} ms ({self.ratio:.2f}x)"
+
+
+def fit_exponent(times: dict[int, float]) -> float:
+    # least squares slope of log(time) against log(scale)
+    points = [(math.log(s), math.log(t)) for s, t in times.items() if t > 0]
+    if len(points) < 2:
+        return 0.0
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def complexity(exponent: float) -> str:
+    power = round(exponent * 2) / 2
+    if power <= 0:
+        return "O(1)"
+    if power == 1:
+        return "O(n)"
+    return f"O(n^{power:g})"
+
+
+def benchmark(
+    day: int, part: int, scales: list[int], repeat: int = 3, seed: int = 0
+) -> Benchmark:
+    # repeats would otherwise only time the first parse
+    cache.ENABLED = False
+    bench = Benchmark(day, part)
+    for scale in scales:
+        path = generate.generated_input(day, scale, seed)
+        results = [runner.run_part(day, part, path) for _ in range(repeat)]
+        if results[0].error:
+            bench.error = results[0].error
+            break
+        bench.times[scale] = min(r.wall for r in results)
+    return bench
+
+
+def load_baseline(path: Path = BASELINE) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def save_baseline(benchmarks: list[Benchmark], path: Path = BASELINE) -> None:
+    baseline = load_baseline(path)
+    for bench in benchmarks:
+        if not bench.error:
+            baseline[bench.key] = bench.to_json()
+    with open(path, "w") as file:
+        json.dump(dict(sorted(baseline.items())), file, indent=2)
+        file.write("\n")
+
+
+def compare(
+    benchmarks: list[Benchmark], baseline: dict[str, dict], threshold: float = THRESHOLD
+) -> list[Regression]:
+    regressions = []
+    for bench in benchmarks:
+        old_times = baseline.get(bench.key, {}).get("times", {})
+        for scale, new in bench.times.items():
+            old = old_times.get(str(scale))
+            if old is None:
+                continue
+            if new > old * (1 + threshold) and new - old > MIN_DELTA:
+                regressions.append(Regression(bench.key, scale, old, new))
+    return regressions
+
+
+def format_benchmark(bench: Benchmark) -> str:
+    if bench.error:
+        return f"{bench.key:>8}  {bench.error}"
+    times = " ".join(
+        f"x{scale}={runner.ms(t).strip()}ms" for scale, t in bench.times.items()
+    )
+    exponent = bench.exponent
+    return f"{bench.key:>8}  {complexity(exponent):>9} (k={exponent:.2f})  {times}"
@@ -0,0 +1,180 @@
+from collections import OrderedDict
+from functools import wraps
+import hashlib
+import inspect
+import os
+from pathlib import Path
+import pickle
+import sys
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+from aoc import ROOT, backend
+
+CACHE_DIR = ROOT / ".cache"
+PARSED_DIR = CACHE_DIR / "parsed"
+ANSWERS_DIR = CACHE_DIR / "answers"
+
+ENABLED = os.environ.get("AOC_CACHE", "1") != "0"
+MAX_ANSWER_BYTES = int(os.environ.get("AOC_ANSWER_CACHE_BYTES", 16 * 2**20))
+MAX_PARSED_BYTES = int(os.environ.get("AOC_PARSED_CACHE_BYTES", 256 * 2**20))
+
+# pickled parse results kept in each process, least recently used dropped first
+MAX_PARSED_MEMORY = 32 * 2**20
+
+T = TypeVar("T")
+
+# pickled parse results by key; solvers mutate what they parse, so every hit
+# is unpickled into fresh objects
+_parsed: OrderedDict[str, bytes] = OrderedDict()
+
+
+def digest(*parts: bytes | str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode() if isinstance(part, str) else part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def source_hash(func: Callable) -> str:
+    return digest(inspect.getsource(func))
+
+
+def write_atomic(path: os.PathLike, data: bytes) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as file:
+        file.write(data)
+    os.replace(tmp, path)
+
+
+def input_bytes(arg: Any) -> bytes:
+    # parsers take a line or the file's lines, which joined back are the file
+    if isinstance(arg, str):
+        return arg.encode()
+    if isinstance(arg, list) and all(isinstance(line, str) for line in arg):
+        return "\n".join(arg).encode()
+    return pickle.dumps(arg, pickle.HIGHEST_PROTOCOL)
+
+
+def remember(key: str, data: bytes) -> None:
+    _parsed[key] = data
+    _parsed.move_to_end(key)
+    total = sum(map(len, _parsed.values()))
+    while total > MAX_PARSED_MEMORY and len(_parsed) > 1:
+        total -= len(_parsed.popitem(last=False)[1])
+
+
+def parsed(func: Callable[..., T]) -> Callable[..., T]:
+    # keyed by the parser's own source and the input it was given, so editing
+    # the parser or the input both miss the cache
+    source = source_hash(func)
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @wraps(func)
+    def cached(*args) -> T:
+        if not ENABLED:
+            return func(*args)
+
+        key = digest(name, source, *map(input_bytes, args))
+        if key in _parsed:
+            _parsed.move_to_end(key)
+            return pickle.loads(_parsed[key])
+
+        path = PARSED_DIR / f"{key}.pickle"
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            result = pickle.loads(data)
+            os.utime(path)
+            remember(key, data)
+            return result
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+        result = func(*args)
+        data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        PARSED_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, data)
+        evict(PARSED_DIR, MAX_PARSED_BYTES)
+        remember(key, data)
+        return result
+
+    return cached
+
+
+def dependencies(module: ModuleType) -> list[ModuleType]:
+    # the module plus every aoc module it reaches through its globals
+    found = {module.__name__: module}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        for value in vars(current).values():
+            name = value.__name__ if isinstance(value, ModuleType) else None
+            name = name or getattr(value, "__module__", None)
+            if not isinstance(name, str) or not name.startswith("aoc."):
+                continue
+            if name not in found and name in sys.modules:
+                found[name] = sys.modules[name]
+                pending.append(sys.modules[name])
+    return [found[name] for name in sorted(found)]
+
+
+_solver_hashes: dict[str, str] = {}
+
+
+def solver_hash(module: ModuleType) -> str:
+    if module.__name__ not in _solver_hashes:
+        sources = [Path(m.__file__).read_bytes() for m in dependencies(module)]
+        _solver_hashes[module.__name__] = digest(*sources)
+    return _solver_hashes[module.__name__]
+
+
+def answer_key(module: ModuleType, solver: str, path: os.PathLike) -> str:
+    # the backend too, so a numpy run never returns the python answer
+    source = solver_hash(module)
+    return digest(source, solver, backend.current(), Path(path).read_bytes())
+
+
+def load_answer(key: str) -> tuple[bool, Any]:
+    path = ANSWERS_DIR / f"{key}.pickle"
+    try:
+        with open(path, "rb") as file:
+            answer = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return False, None
+
+    # mark as recently used for eviction
+    os.utime(path)
+    return True, answer
+
+
+def store_answer(key: str, answer: Any) -> None:
+    ANSWERS_DIR.mkdir(parents=True, exist_ok=True)
+    write_atomic(ANSWERS_DIR / f"{key}.pickle", pickle.dumps(answer))
+    evict(ANSWERS_DIR, MAX_ANSWER_BYTES)
+
+
+def evict(directory: Path, max_bytes: int) -> None:
+    # least recently used first, until the directory fits the budget
+    entries = []
+    for path in directory.glob("*.pickle"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def clear() -> None:
+    _parsed.clear()
+    for directory in (PARSED_DIR, ANSWERS_DIR):
+        for path in directory.glob("*.pickle"):
+            path.unlink()
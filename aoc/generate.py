@@ -0,0 +1,40 @@
+import importlib
+from pathlib import Path
+from types import ModuleType
+
+from aoc import ROOT
+from aoc.runner import day_name, load_day
+
+SCALES = (1, 10, 100, 1000)
+
+
+def load_generator(day: int) -> ModuleType:
+    load_day(day)
+    return importlib.import_module(f"{day_name(day)}.generate")
+
+
+def generate(day: int, scale: int = 1, seed: int = 0) -> list[str]:
+    return load_generator(day).generate(scale, seed)
+
+
+def generated_path(day: int, scale: int, seed: int = 0) -> Path:
+    return ROOT / day_name(day) / "generated" / f"x{scale}_seed{seed}.txt"
+
+
+def write_input(
+    day: int, scale: int = 1, seed: int = 0, path: Path | None = None
+) -> Path:
+    path = path or generated_path(day, scale, seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        file.write("\n".join(generate(day, scale, seed)))
+    return path
+
+
+def generated_input(day: int, scale: int, seed: int = 0) -> Path:
+    # written again once the generator changes, so edits don't leave it stale
+    path = generated_path(day, scale, seed)
+    source = Path(load_generator(day).__file__)
+    if not path.exists() or path.stat().st_mtime < source.stat().st_mtime:
+        write_input(day, scale, seed, path)
+    return path
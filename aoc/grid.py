@@ -0,0 +1,126 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+
+from aoc import backend
+from aoc.points import Vector
+
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+ORTHOGONAL = ((0, -1), (-1, 0), (1, 0), (0, 1))
+DIAGONAL = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+# tables are two ints per neighbor, so only keep those of the last few shapes
+# (a batch of one day's inputs shares one or two)
+TABLES = 4
+
+
+@lru_cache(maxsize=TABLES)
+def neighbor_table(width: int, height: int, diagonal: bool) -> tuple[array, array]:
+    # neighbors of cell i are targets[starts[i] : starts[i + 1]]
+    offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+    starts = array("l", [0])
+    targets = array("l")
+    for y in range(height):
+        for x in range(width):
+            for dx, dy in offsets:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    targets.append(ny * width + nx)
+            starts.append(len(targets))
+    return starts, targets
+
+
+@dataclass
+class Grid:
+    width: int
+    height: int
+    cells: array
+
+    @classmethod
+    def from_digits(cls, lines: Iterable[str], typecode: str = "b") -> Grid:
+        raw = [line.encode() for line in lines]
+        if not raw:
+            raise ValueError("empty grid")
+        for y, row in enumerate(raw):
+            # bytes.isdigit is ASCII-only, so translate can't pass anything through
+            if not row.isdigit():
+                raise ValueError(f"row {y} isn't all digits: {row[:20]!r}")
+            if len(row) != len(raw[0]):
+                raise ValueError(f"row {y} is {len(row)} wide, expected {len(raw[0])}")
+        rows = [row.translate(DIGITS) for row in raw]
+        cells = array("b", b"".join(rows))
+        if typecode != "b":
+            cells = array(typecode, cells)
+        return cls(len(rows[0]), len(rows), cells)
+
+    @classmethod
+    def filled(
+        cls, width: int, height: int, value: int = 0, typecode: str = "b"
+    ) -> Grid:
+        return cls(width, height, array(typecode, [value]) * (width * height))
+
+    @property
+    def size(self) -> int:
+        return len(self.cells)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def point(self, index: int) -> Vector:
+        y, x = divmod(index, self.width)
+        return Vector(x, y)
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def ndarray(self):
+        # numpy view sharing memory with cells, (height, width) shaped
+        view = backend.np.frombuffer(self.cells, dtype=self.cells.typecode)
+        return view.reshape(self.height, self.width)
+
+    def neighbors4(self, index: int) -> array:
+        starts, targets = neighbor_table(self.width, self.height, False)
+        return targets[starts[index] : starts[index + 1]]
+
+    def neighbors8(self, index: int) -> array:
+        starts, targets = neighbor_table(self.width, self.height, True)
+        return targets[starts[index] : starts[index + 1]]
+
+    def add(self, value: int) -> None:
+        self.cells = array(self.cells.typecode, [c + value for c in self.cells])
+
+    def indices(self, predicate: Callable[[int], bool]) -> list[int]:
+        return [i for i, c in enumerate(self.cells) if predicate(c)]
+
+    def count(self, predicate: Callable[[int], bool]) -> int:
+        return sum(1 for c in self.cells if predicate(c))
+
+    def put(self, indices: Iterable[int], value: int) -> None:
+        cells = self.cells
+        for i in indices:
+            cells[i] = value
+
+    def rows(self) -> Iterator[array]:
+        for y in range(self.height):
+            yield self.cells[y * self.width : (y + 1) * self.width]
+
+    def tile(self, times: int, step: Callable[[int, int], int]) -> Grid:
+        # repeat the grid times x times, block (i, j) mapping cells via step(c, i + j)
+        width = self.width * times
+        if backend.NUMPY:
+            # step sees whole blocks, so it has to be plain arithmetic
+            base = self.ndarray()
+            blocks = [[step(base, i + j) for i in range(times)] for j in range(times)]
+            tiled = backend.np.block(blocks).astype(base.dtype)
+            cells = array(self.cells.typecode, tiled.tobytes())
+            return Grid(width, self.height * times, cells)
+
+        cells = array(self.cells.typecode)
+        for j in range(times):
+            for row in self.rows():
+                for i in range(times):
+                    cells.extend(step(c, i + j) for c in row)
+        return Grid(width, self.height * times, cells)
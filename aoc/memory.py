@@ -0,0 +1,160 @@
+from __future__ import annotations
+import _thread
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import re
+import resource
+import signal
+import sys
+import threading
+from types import FrameType
+
+from aoc import ROOT
+
+BUDGETS = ROOT / "budgets.json"
+MIB = 2**20
+
+_STATUS = Path("/proc/self/status")
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+# how often a running part's RSS is compared with its budget (s)
+WATCH_INTERVAL = 0.05
+
+# raised into the solver by the watchdog; the handler is only installed while
+# a part runs
+WATCH_SIGNAL = getattr(signal, "SIGUSR1", None)
+
+
+@dataclass
+class Usage:
+    peak_rss: int  # bytes, high-water mark while the part ran
+    blocks: int  # allocated blocks still held when the solver returned
+    start_rss: int = 0  # bytes resident when the part started
+
+    @property
+    def growth(self) -> int:
+        # what the part added; memory kept from earlier parts isn't its own
+        return max(0, self.peak_rss - self.start_rss)
+
+
+class MemoryBudgetExceeded(Exception):
+    pass
+
+
+def reset_peak() -> bool:
+    # linux lets a process reset its own VmHWM; elsewhere the peak is the
+    # process lifetime maximum
+    try:
+        _CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def status_kb(field: str) -> int | None:
+    try:
+        status = _STATUS.read_text()
+    except OSError:
+        return None
+    match = re.search(rf"{field}:\s+(\d+) kB", status)
+    return int(match.group(1)) * 1024 if match else None
+
+
+def current_rss() -> int:
+    # falls back to the peak where /proc isn't available
+    rss = status_kb("VmRSS")
+    return peak_rss() if rss is None else rss
+
+
+def peak_rss() -> int:
+    peak = status_kb("VmHWM")
+    if peak is not None:
+        return peak
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def allocated_blocks() -> int:
+    return sys.getallocatedblocks()
+
+
+def load_budgets(path: os.PathLike = BUDGETS) -> dict[str, int]:
+    # {"default": 512, "day15": 256} in MiB of RSS growth while a part runs
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return {key: int(mib * MIB) for key, mib in json.loads(path.read_text()).items()}
+
+
+def budget_for(budgets: dict[str, int], name: str) -> int | None:
+    return budgets.get(name, budgets.get("default"))
+
+
+def over_budget(growth: int, budget: int) -> MemoryBudgetExceeded:
+    return MemoryBudgetExceeded(
+        f"RSS grew {mib(growth)} MiB, over budget of {mib(budget)} MiB"
+    )
+
+
+def check(usage: Usage, budget: int | None) -> None:
+    if budget is not None and usage.growth > budget:
+        raise over_budget(usage.growth, budget)
+
+
+class Watchdog:
+    # polls RSS from a thread while a part runs and raises
+    # MemoryBudgetExceeded in the main thread as soon as the part has grown
+    # past its budget, rather than once it returns; without /proc, a signal
+    # or when not on the main thread, only check() after the part applies
+    def __init__(self, budget: int | None, start: int, interval: float = WATCH_INTERVAL):
+        self.budget = budget
+        self.start = start
+        self.interval = interval
+        self.growth = 0
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        self.previous = None
+
+    def usable(self) -> bool:
+        return (
+            self.budget is not None
+            and WATCH_SIGNAL is not None
+            and status_kb("VmRSS") is not None
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def __enter__(self) -> Watchdog:
+        if self.usable():
+            self.previous = signal.signal(WATCH_SIGNAL, self.interrupt)
+            self.thread = threading.Thread(target=self.watch, daemon=True)
+            self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.thread is None:
+            return
+        with self.lock:
+            self.stopped.set()
+        self.thread.join()
+        signal.signal(WATCH_SIGNAL, self.previous)
+
+    def watch(self) -> None:
+        while not self.stopped.wait(self.interval):
+            growth = (status_kb("VmRSS") or 0) - self.start
+            if growth > self.budget:  # type: ignore[operator]
+                with self.lock:
+                    if not self.stopped.is_set():
+                        self.growth = growth
+                        _thread.interrupt_main(WATCH_SIGNAL)
+                return
+
+    def interrupt(self, signum: int, frame: FrameType | None) -> None:
+        raise over_budget(self.growth, self.budget)  # type: ignore[arg-type]
+
+
+def mib(size: int) -> str:
+    return f"{size / MIB:.1f}"
@@ -0,0 +1,54 @@
+from __future__ import annotations
+from typing import NamedTuple
+
+# Points are plain tuples underneath: hashing and equality are the tuple's own,
+# so they never build strings and (1, 23) and (12, 3) stay distinct.
+
+
+class Vector(NamedTuple):
+    x: int
+    y: int
+
+    def __add__(self, __o: tuple) -> Vector:  # type: ignore[override]
+        return Vector(self.x + __o[0], self.y + __o[1])
+
+    def __sub__(self, __o: tuple) -> Vector:
+        return Vector(self.x - __o[0], self.y - __o[1])
+
+    def __neg__(self) -> Vector:
+        return Vector(-self.x, -self.y)
+
+    def __mul__(self, __o: int) -> Vector:  # type: ignore[override]
+        return Vector(self.x * __o, self.y * __o)
+
+    def __repr__(self) -> str:
+        return f"({self.x}, {self.y})"
+
+    @property
+    def manhattan(self) -> int:
+        return abs(self.x) + abs(self.y)
+
+
+class Vector3(NamedTuple):
+    x: int
+    y: int
+    z: int
+
+    def __add__(self, __o: tuple) -> Vector3:  # type: ignore[override]
+        return Vector3(self.x + __o[0], self.y + __o[1], self.z + __o[2])
+
+    def __sub__(self, __o: tuple) -> Vector3:
+        return Vector3(self.x - __o[0], self.y - __o[1], self.z - __o[2])
+
+    def __neg__(self) -> Vector3:
+        return Vector3(-self.x, -self.y, -self.z)
+
+    def __mul__(self, __o: int) -> Vector3:  # type: ignore[override]
+        return Vector3(self.x * __o, self.y * __o, self.z * __o)
+
+    def __repr__(self) -> str:
+        return f"({self.x}, {self.y}, {self.z})"
+
+    @property
+    def manhattan(self) -> int:
+        return abs(self.x) + abs(self.y) + abs(self.z)
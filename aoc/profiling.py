@@ -0,0 +1,189 @@
+import cProfile
+from collections import Counter
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+import io
+from pathlib import Path
+import pstats
+import signal
+import tracemalloc
+from types import FrameType
+from typing import Any, Callable
+
+# sampled stacks stop at the first frame from these, i.e. at the call into
+# the solver
+OWN_MODULES = {__name__, "aoc.runner"}
+
+# how often traced memory is checked for a new peak snapshot (s)
+SNAPSHOT_INTERVAL = 0.001
+
+
+@dataclass
+class Hotspot:
+    function: str
+    calls: int
+    own: float
+    cumulative: float
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class Profile:
+    answer: Any = None
+    hotspots: list[Hotspot] = field(default_factory=list)
+    peak: int = 0
+    allocations: list[AllocationSite] = field(default_factory=list)
+    snapshot: int = 0  # traced bytes when the allocation sites were taken
+    final: bool = False  # sites come from after the part, not near its peak
+    stacks: Counter = field(default_factory=Counter)
+
+
+def function_name(key: tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name
+    return f"{Path(filename).parent.name}/{Path(filename).name}:{line}({name})"
+
+
+def hotspots(call: Callable[[], Any], top: int) -> tuple[Any, list[Hotspot]]:
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(call)
+
+    stats = pstats.Stats(profiler)
+    rows = [
+        Hotspot(function_name(key), calls, own, cumulative)
+        for key, (_, calls, own, cumulative, _) in stats.stats.items()  # type: ignore
+    ]
+    rows.sort(key=lambda h: h.own, reverse=True)
+    return answer, rows[:top]
+
+
+def allocations(
+    call: Callable[[], Any], top: int, interval: float = SNAPSHOT_INTERVAL
+) -> tuple[int, int, bool, list[AllocationSite]]:
+    # tracemalloc only knows what is alive when a snapshot is taken, so the
+    # snapshot is refreshed from a timer whenever usage grows past its peak;
+    # a part over before the first tick only leaves what survives it
+    peak_snapshot: list[tracemalloc.Snapshot] = []
+    snapshot_size = 0
+
+    def check(signum: int, frame: FrameType | None) -> None:
+        nonlocal snapshot_size
+        current, _ = tracemalloc.get_traced_memory()
+        if current > snapshot_size * 1.1:
+            snapshot_size = current
+            peak_snapshot[:] = [tracemalloc.take_snapshot()]
+
+    tracemalloc.start()
+    previous = signal.signal(signal.SIGPROF, check)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        call()
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        current, peak = tracemalloc.get_traced_memory()
+        final = not peak_snapshot
+        if final:
+            snapshot_size = current
+            peak_snapshot.append(tracemalloc.take_snapshot())
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+        tracemalloc.stop()
+
+    stats = peak_snapshot[0].statistics("lineno")[:top]
+    sites = [
+        AllocationSite(
+            f"{Path(s.traceback[0].filename).parent.name}/"
+            f"{Path(s.traceback[0].filename).name}:{s.traceback[0].lineno}",
+            s.size,
+            s.count,
+        )
+        for s in stats
+    ]
+    return peak, snapshot_size, final, sites
+
+
+def stack_key(frame: FrameType | None) -> str:
+    names = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        if module in OWN_MODULES:
+            break
+        names.append(f"{module}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def sample_stacks(call: Callable[[], Any], interval: float) -> Counter:
+    stacks: Counter = Counter()
+
+    def sample(signum: int, frame: FrameType | None) -> None:
+        stacks[stack_key(frame)] += 1
+
+    previous = signal.signal(signal.SIGPROF, sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        call()
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+    return stacks
+
+
+def profile(
+    call: Callable[[], Any],
+    top: int = 20,
+    memory: bool = True,
+    stacks: bool = False,
+    interval: float = 0.001,
+) -> Profile:
+    # every instrument gets its own run so they don't skew each other
+    result = Profile()
+    with redirect_stdout(io.StringIO()):
+        result.answer, result.hotspots = hotspots(call, top)
+        if memory:
+            result.peak, result.snapshot, result.final, result.allocations = (
+                allocations(call, top)
+            )
+        if stacks:
+            result.stacks = sample_stacks(call, interval)
+    return result
+
+
+def write_collapsed(stacks: Counter, path: Path) -> None:
+    # one "frame;frame;frame count" line per stack, as flamegraph.pl and
+    # speedscope expect
+    with open(path, "w") as file:
+        for stack, count in stacks.most_common():
+            file.write(f"{stack} {count}\n")
+
+
+def format_hotspots(rows: list[Hotspot]) -> str:
+    lines = [f"{'calls':>10} {'own ms':>10} {'cum ms':>10}  function"]
+    for h in rows:
+        own, cumulative = h.own * 1000, h.cumulative * 1000
+        lines.append(f"{h.calls:>10} {own:10.2f} {cumulative:10.2f}  {h.function}")
+    return "\n".join(lines)
+
+
+def format_allocations(
+    peak: int, sites: list[AllocationSite], snapshot: int = 0, final: bool = False
+) -> str:
+    # the timer can miss a short spike, so say how close the sites came
+    share = snapshot / peak if peak else 1.0
+    when = ", taken after the part ended" if final else ""
+    lines = [
+        f"peak traced memory: {peak / 1024:.1f} KiB",
+        f"sites from a snapshot at {snapshot / 1024:.1f} KiB"
+        f" ({share:.0%} of the peak{when})",
+        f"{'KiB':>10} {'blocks':>10}  site",
+    ]
+    for s in sites:
+        lines.append(f"{s.size / 1024:10.1f} {s.count:>10}  {s.location}")
+    return "\n".join(lines)
@@ -0,0 +1,41 @@
+import mmap
+import os
+from typing import Iterator
+
+
+def read_lines(path: str | os.PathLike, use_mmap: bool = False) -> Iterator[str]:
+    if use_mmap:
+        yield from read_mapped(path)
+        return
+
+    with open(path, "r") as file:
+        for line in file:
+            yield line.rstrip("\r\n")
+
+
+def read_mapped(path: str | os.PathLike) -> Iterator[str]:
+    with open(path, "rb") as file:
+        # mmap refuses empty files
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.rstrip(b"\r\n").decode()
+
+
+def read_range(path: str | os.PathLike, start: int, end: int) -> bytes:
+    # whole lines whose first byte falls in [start, end), so consecutive
+    # ranges split a file without cutting or repeating a line
+    with open(path, "rb") as file:
+        if start:
+            file.seek(start - 1)
+            file.readline()
+        data = file.read(max(0, end - file.tell()))
+        if data and not data.endswith(b"\n"):
+            data += file.readline()
+    return data
+
+
+def byte_ranges(path: str | os.PathLike, size: int) -> list[tuple[int, int]]:
+    total = os.path.getsize(path)
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
@@ -0,0 +1,183 @@
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import dataclass
+from functools import wraps
+import gc
+import importlib
+import io
+from pathlib import Path
+import sys
+import time
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Iterator
+
+from aoc import ROOT, cache, memory
+
+# module level functions treated as parsing when timing a part
+PARSERS = ("read_file", "parse_", "load_", "create_graph")
+
+
+def day_name(day: int) -> str:
+    return f"day{day:02d}"
+
+
+def available_days() -> list[int]:
+    return sorted(int(p.parent.name[3:]) for p in ROOT.glob("day[0-9][0-9]/main.py"))
+
+
+def load_day(day: int) -> ModuleType:
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return importlib.import_module(f"{day_name(day)}.main")
+
+
+def input_path(day: int, sample: bool = False) -> Path:
+    return ROOT / day_name(day) / ("sample.txt" if sample else "input.txt")
+
+
+@dataclass
+class ParseTimer:
+    elapsed: float = 0.0
+    depth: int = 0
+
+    def wrap(self, func: Callable) -> Callable:
+        @wraps(func)
+        def timed(*args, **kwargs):
+            self.depth += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.elapsed += time.perf_counter() - start
+
+        return timed
+
+
+@contextmanager
+def timed_parsers(module: ModuleType, timer: ParseTimer) -> Iterator[ParseTimer]:
+    originals = {
+        name: func
+        for name, func in vars(module).items()
+        if isinstance(func, FunctionType)
+        and func.__module__ == module.__name__
+        and name.startswith(PARSERS)
+    }
+    for name, func in originals.items():
+        setattr(module, name, timer.wrap(func))
+    try:
+        yield timer
+    finally:
+        for name, func in originals.items():
+            setattr(module, name, func)
+
+
+@dataclass
+class Result:
+    day: int
+    part: int
+    answer: Any
+    wall: float
+    cpu: float
+    parse: float
+    error: str = ""
+    cached: bool = False
+    rss_growth: int = 0
+    blocks: int = 0
+    over_budget: bool = False
+
+    @property
+    def solve(self) -> float:
+        return self.wall - self.parse
+
+
+def solver_call(day: int, part: int, path: Path) -> Callable[[], Any]:
+    module = load_day(day)
+    solver = getattr(module, f"part_{part}")
+    return lambda: solver(module.read_file(str(path)))
+
+
+def run_part(
+    day: int,
+    part: int,
+    path: Path,
+    quiet: bool = True,
+    budget: int | None = None,
+    solver: str = "part",
+) -> Result:
+    module = load_day(day)
+    name = f"{solver}_{part}"
+    solve = getattr(module, name)
+
+    if cache.ENABLED:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        key = cache.answer_key(module, name, path)
+        hit, answer = cache.load_answer(key)
+        if hit:
+            cpu = time.process_time() - cpu
+            wall = time.perf_counter() - wall
+            return Result(day, part, answer, wall, cpu, 0.0, cached=True)
+
+    output = redirect_stdout(io.StringIO()) if quiet else nullcontext()
+
+    with timed_parsers(module, ParseTimer()) as timer, output:
+        gc.collect()  # so garbage from earlier parts isn't counted as freed here
+        memory.reset_peak()
+        start_rss = memory.current_rss()
+        blocks = memory.allocated_blocks()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        answer, error, over_budget = None, "", False
+        try:
+            with memory.Watchdog(budget, start_rss):
+                # keep the parsed input alive so its blocks are counted
+                data = module.read_file(str(path))
+                answer = solve(data)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            over_budget = isinstance(e, memory.MemoryBudgetExceeded)
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+        usage = memory.Usage(
+            memory.peak_rss(), memory.allocated_blocks() - blocks, start_rss
+        )
+        data = None
+
+    try:
+        memory.check(usage, budget)
+    except memory.MemoryBudgetExceeded as e:
+        error, over_budget = error or f"{type(e).__name__}: {e}", True
+
+    if cache.ENABLED and not error:
+        cache.store_answer(key, answer)
+
+    result = Result(day, part, answer, wall, cpu, timer.elapsed, error)
+    result.rss_growth, result.blocks = usage.growth, usage.blocks
+    result.over_budget = over_budget
+    return result
+
+
+def ms(seconds: float) -> str:
+    return f"{seconds * 1000:10.2f}"
+
+
+def format_header() -> str:
+    return f"{'day':>5} {'part':>4} {'wall ms':>10} {'cpu ms':>10} {'parse ms':>10} {'solve ms':>10} {'grew MiB':>9} {'blocks':>9}  answer"  # noqa
+
+
+def format_result(r: Result) -> str:
+    times = " ".join(ms(t) for t in (r.wall, r.cpu, r.parse, r.solve))
+    usage = f"{memory.mib(r.rss_growth):>9} {r.blocks:>9}"
+    answer = f"{r.answer} (cached)" if r.cached else r.answer
+    return f"{day_name(r.day):>5} {r.part:>4} {times} {usage}  {r.error or answer}"
+
+
+def format_total(results: list[Result]) -> str:
+    totals = [
+        sum(r.wall for r in results),
+        sum(r.cpu for r in results),
+        sum(r.parse for r in results),
+        sum(r.solve for r in results),
+    ]
+    return f"{'total':>5} {'':>4} {' '.join(ms(t) for t in totals)}"
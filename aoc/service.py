@@ -0,0 +1,164 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+from aoc import batch, cache, runner
+
+HOST = "127.0.0.1"
+PORT = 8021
+
+# requests and responses are single JSON objects, one per line:
+#   {"day": 15, "part": 1, "input": "1163751742\n..."}
+#   {"op": "stats"}
+
+
+def load_days() -> None:
+    for day in runner.available_days():
+        runner.load_day(day)
+
+
+def init_worker(cache_enabled: bool) -> None:
+    cache.ENABLED = cache_enabled
+    load_days()
+
+
+def solve_text(day: int, part: int, text: str) -> runner.Result:
+    # the days only know how to read files
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "input.txt"
+        path.write_text(text)
+        return runner.run_part(day, part, path)
+
+
+@dataclass
+class Service:
+    workers: int | None = None
+    pending: dict[str, asyncio.Future] = field(default_factory=dict)
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=10000))
+    requests: int = 0
+    coalesced: int = 0
+
+    def __post_init__(self) -> None:
+        self.workers = self.workers or os.cpu_count() or 1
+        self.days = set(runner.available_days())
+        load_days()
+        self.pool = ProcessPoolExecutor(
+            self.workers, initializer=init_worker, initargs=(cache.ENABLED,)
+        )
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+    async def solve(self, day: int, part: int, text: str) -> runner.Result:
+        # identical requests in flight share one job
+        key = cache.digest(str(day), str(part), text)
+        future = self.pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = asyncio.ensure_future(
+                loop.run_in_executor(self.pool, solve_text, day, part, text)
+            )
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self.pending.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, Any]:
+        latencies = list(self.latencies)
+        in_flight = len(self.pending)
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - (self.workers or 1)),
+            "workers": self.workers,
+            "p50_ms": batch.percentile(latencies, 0.5) * 1000,
+            "p99_ms": batch.percentile(latencies, 0.99) * 1000,
+        }
+
+    async def dispatch(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"error": "bad request: expected a JSON object"}
+        if request.get("op") == "stats":
+            return self.stats()
+
+        day, part, text = request["day"], request["part"], request["input"]
+        if day not in self.days:
+            return {"error": f"unknown day {day}"}
+        if part not in (1, 2):
+            return {"error": f"unknown part {part}"}
+
+        start = time.perf_counter()
+        self.requests += 1
+        result = await self.solve(day, part, text)
+        latency = time.perf_counter() - start
+        self.latencies.append(latency)
+
+        if result.error:
+            return {"error": result.error}
+        return {
+            "answer": result.answer,
+            "solve_ms": result.wall * 1000,
+            "latency_ms": latency * 1000,
+            "cached": result.cached,
+        }
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.dispatch(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"error": f"bad request: {type(e).__name__}: {e}"}
+                writer.write(json.dumps(response, default=repr).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(
+    socket: Path | None = None,
+    port: int = PORT,
+    workers: int | None = None,
+    ready: asyncio.Event | None = None,
+) -> None:
+    service = Service(workers)
+    limit = 2**30  # whole puzzle inputs arrive on one line
+    try:
+        if socket:
+            server = await asyncio.start_unix_server(service.handle, socket, limit=limit)
+        else:
+            server = await asyncio.start_server(service.handle, HOST, port, limit=limit)
+        async with server:
+            if ready:
+                ready.set()
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+async def request(
+    message: dict[str, Any], socket: Path | None = None, port: int = PORT
+) -> dict[str, Any]:
+    limit = 2**30
+    if socket:
+        reader, writer = await asyncio.open_unix_connection(socket, limit=limit)
+    else:
+        reader, writer = await asyncio.open_connection(HOST, port, limit=limit)
+    try:
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
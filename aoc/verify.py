@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+import inspect
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator
+
+from aoc import ROOT, backend, cache, generate, runner
+
+EXPECTED = ROOT / "answers.json"
+KINDS = ("sample", "input")
+
+# a day can keep its straightforward solution next to a faster one as
+# reference_part_1 / reference_part_2; both are checked against each other
+REFERENCE = "reference_part"
+
+
+def normalize(answer: Any) -> Any:
+    # the form an answer takes once stored in answers.json
+    return json.loads(json.dumps(answer, default=repr))
+
+
+@dataclass
+class Check:
+    day: int
+    part: int
+    kind: str
+    expected: Any
+    result: runner.Result
+
+    @property
+    def ok(self) -> bool:
+        return not self.result.error and normalize(self.result.answer) == self.expected
+
+
+@dataclass
+class Comparison:
+    day: int
+    part: int
+    path: Path
+    results: dict[str, runner.Result]
+
+    @property
+    def answers(self) -> dict[str, object]:
+        return {name: r.error or r.answer for name, r in self.results.items()}
+
+    @property
+    def ok(self) -> bool:
+        return len(set(map(repr, self.answers.values()))) == 1
+
+
+def load_expected(path: os.PathLike = EXPECTED) -> dict[str, dict[str, dict]]:
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_expected(expected: dict, path: os.PathLike = EXPECTED) -> None:
+    Path(path).write_text(json.dumps(expected, indent=2, sort_keys=True) + "\n")
+
+
+def check_answers(
+    day: int, parts: list[int], expected: dict, kinds: tuple[str, ...] = KINDS
+) -> Iterator[Check]:
+    # parts without a stored answer are skipped
+    answers = expected.get(runner.day_name(day), {})
+    for kind in kinds:
+        path = runner.input_path(day, kind == "sample")
+        for part in parts:
+            if str(part) in answers.get(kind, {}):
+                result = runner.run_part(day, part, path)
+                yield Check(day, part, kind, answers[kind][str(part)], result)
+
+
+def record(
+    day: int, parts: list[int], expected: dict, kinds: tuple[str, ...] = KINDS
+) -> list[runner.Result]:
+    results = []
+    for kind in kinds:
+        path = runner.input_path(day, kind == "sample")
+        for part in parts:
+            result = runner.run_part(day, part, path)
+            # a solver that returns nothing has no answer worth pinning
+            if not result.error and result.answer is not None:
+                answers = expected.setdefault(runner.day_name(day), {})
+                answers.setdefault(kind, {})[str(part)] = normalize(result.answer)
+            results.append(result)
+    return results
+
+
+def branches_on_backend(module: ModuleType) -> bool:
+    # importing aoc.backend isn't enough (aoc.cache does, for its keys); a
+    # module has kernels only if it reads the switch
+    return "backend.NUMPY" in inspect.getsource(module)
+
+
+def uses_backend(day: int) -> bool:
+    modules = cache.dependencies(runner.load_day(day))
+    return any(branches_on_backend(module) for module in modules)
+
+
+def has_reference(day: int, part: int) -> bool:
+    return hasattr(runner.load_day(day), f"{REFERENCE}_{part}")
+
+
+def has_fast_path(day: int, part: int) -> bool:
+    # only worth checking when there is a second implementation to run
+    numpy = len(backend.available()) > 1 and uses_backend(day)
+    return numpy or has_reference(day, part)
+
+
+def cross_check(day: int, part: int, path: Path) -> Comparison:
+    # the solver under every available backend, plus the reference when the
+    # day keeps one, all solving the same input from scratch
+    results = {}
+    enabled, cache.ENABLED = cache.ENABLED, False
+    try:
+        for name in backend.available():
+            with backend.using(name):
+                results[name] = runner.run_part(day, part, path)
+        if has_reference(day, part):
+            results["reference"] = runner.run_part(day, part, path, solver=REFERENCE)
+    finally:
+        cache.ENABLED = enabled
+    return Comparison(day, part, path, results)
+
+
+def cross_check_generated(
+    day: int, part: int, seeds: range, scale: int = 1
+) -> Iterator[Comparison]:
+    for seed in seeds:
+        yield cross_check(day, part, generate.generated_input(day, scale, seed))
+
+
+def gate(days: list[int], parts: list[int], seeds: range = range(3)) -> list[str]:
+    # everything that has to hold before timings mean anything
+    failures = []
+    expected = load_expected()
+    for day in days:
+        for check in check_answers(day, parts, expected):
+            if not check.ok:
+                failures.append(format_check(check))
+        for part in parts:
+            if not has_fast_path(day, part):
+                continue
+            for comparison in cross_check_generated(day, part, seeds):
+                if not comparison.ok:
+                    failures.append(format_comparison(comparison))
+    return failures
+
+
+def format_check(c: Check) -> str:
+    status = "ok" if c.ok else "FAIL"
+    answer = c.result.error or c.result.answer
+    detail = "" if c.ok else f" (expected {c.expected})"
+    name = runner.day_name(c.day)
+    return f"{name:>5} {c.part:>4} {c.kind:>6}  {status:<8} {answer}{detail}"
+
+
+def format_comparison(c: Comparison) -> str:
+    status = "ok" if c.ok else "MISMATCH"
+    times = [f"{n} {runner.ms(r.wall).strip()} ms" for n, r in c.results.items()]
+    answers = " / ".join(str(a) for a in c.answers.values())
+    name = runner.day_name(c.day)
+    return (
+        f"{name:>5} {c.part:>4} {c.path.stem:>12}  {status:<8} {answers}"
+        f"  ({', '.join(times)})"
+    )
@@ -0,0 +1,12 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    depth = rng.randint(100, 200)
+    lines = []
+    for _ in range(2000 * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        lines.append(str(depth))
+    return lines
@@ -1,39 +1,128 @@
-def read_file(path: str) -> list[int]:
-    with open(path, "r") as file:
-        return [int(line) for line in file.readlines()]
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from operator import gt
+import os
+from pathlib import Path
+import sys
+from typing import Iterable, Iterator
 
+from aoc import backend
+from aoc.reader import byte_ranges, read_lines, read_range
 
-def part_1(measurements: list[int]) -> int:
+# bytes of the file each bulk worker parses at a time
+CHUNK = 1 << 22
 
-    count: int = 0
+
+def read_file(path: str) -> Iterator[int]:
+    return (int(line) for line in read_lines(path))
+
+
+def increases(measurements: Iterable[int], window: int = 1) -> Iterator[int]:
+    # yields the index of the last reading of every window whose sum beats the
+    # window before it; neighboring windows share all but one reading, so
+    # comparing the sums is comparing the reading entering with the one leaving
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+
+    recent: deque[int] = deque(maxlen=window)
     for i, m in enumerate(measurements):
-        if i == 0:
-            continue
-        if m > measurements[i - 1]:
-            count += 1
+        if len(recent) == window and m > recent[0]:
+            yield i
+        recent.append(m)
 
-    return count
+
+def count_increases(measurements: Iterable[int], window: int = 1) -> int:
+    return sum(1 for _ in increases(measurements, window))
+
+
+def part_1(measurements: Iterable[int]) -> int:
+    return count_increases(measurements, 1)
+
+
+def part_2(measurements: Iterable[int]) -> int:
+    return count_increases(measurements, 3)
+
+
+def parse_bulk(data: bytes):
+    # array('q'), or an int64 ndarray with the numpy backend
+    if backend.NUMPY:
+        return backend.np.fromstring(data, dtype=backend.np.int64, sep=" ")
+    return array("q", map(int, data.split()))
 
 
-def part_2(measurements: list[int]) -> int:
+def shifted_increases(values, window: int = 1) -> int:
+    # reading i against reading i - window for every i at once
+    if backend.NUMPY:
+        return int(backend.np.count_nonzero(values[window:] > values[:-window]))
+    return sum(map(gt, values[window:], values))
 
-    count: int = 0
-    for i in range(len(measurements)):
-        if i == 0:
-            continue
-        if i >= len(measurements) - 2:
-            break
 
-        current_sum: int = sum(measurements[i : i + 3])
-        previous_sum: int = sum(measurements[i - 1 : i + 2])
+@dataclass
+class Chunk:
+    count: int  # increases with both readings inside the chunk
+    head: list[int]  # first window readings
+    tail: list[int]  # last window readings
 
-        if current_sum > previous_sum:
-            count += 1
 
+def count_chunk(path: str | os.PathLike, start: int, end: int, window: int) -> Chunk:
+    values = parse_bulk(read_range(path, start, end))
+    head, tail = values[:window].tolist(), values[-window:].tolist()
+    return Chunk(shifted_increases(values, window), head, tail)
+
+
+def stitch(chunks: Iterable[Chunk], window: int) -> int:
+    # windows ending in a chunk's first readings start in earlier chunks,
+    # possibly several when chunks are shorter than the window
+    count = 0
+    previous: list[int] = []
+    for chunk in chunks:
+        boundary = previous + chunk.head
+        count += chunk.count + sum(map(gt, boundary[window:], boundary))
+        previous = (previous + chunk.tail)[-window:]
     return count
 
 
+def count_file(
+    path: str | os.PathLike,
+    window: int = 1,
+    workers: int | None = None,
+    chunk: int = CHUNK,
+) -> int:
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+
+    ranges = byte_ranges(path, chunk)
+    starts, ends = [s for s, _ in ranges], [e for _, e in ranges]
+    args = (repeat(path), starts, ends, repeat(window))
+    if workers == 1 or len(ranges) == 1:
+        return stitch(map(count_chunk, *args), window)
+    with ProcessPoolExecutor(workers) as pool:
+        return stitch(pool.map(count_chunk, *args), window)
+
+
+def reference_window_sums(measurements: Iterable[int], window: int) -> int:
+    measurements = list(measurements)
+    sums = [
+        sum(measurements[i : i + window])
+        for i in range(len(measurements) - window + 1)
+    ]
+    return sum(1 for a, b in zip(sums, sums[1:]) if b > a)
+
+
+def reference_part_1(measurements: Iterable[int]) -> int:
+    return reference_window_sums(measurements, 1)
+
+
+def reference_part_2(measurements: Iterable[int]) -> int:
+    return reference_window_sums(measurements, 3)
+
+
 if __name__ == "__main__":
-    measurements = read_file("input.txt")
-    out = part_2(measurements)
+    # python -m day01.main [window] [file], counting in bulk on every core
+    window = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    path = sys.argv[2] if len(sys.argv) > 2 else Path(__file__).parent / "input.txt"
+    out = count_file(path, window)
     print(out)
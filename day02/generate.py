@@ -0,0 +1,11 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    commands = ["forward", "down", "up"]
+    weights = [2, 2, 1]
+    return [
+        f"{rng.choices(commands, weights)[0]} {rng.randint(1, 9)}"
+        for _ in range(1000 * scale)
+    ]
@@ -1,4 +1,23 @@
-from dataclasses import dataclass
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import reduce
+from itertools import islice, repeat
+import os
+from pathlib import Path
+import sys
+from typing import BinaryIO, Iterable, Iterator
+
+from aoc.reader import byte_ranges, read_lines, read_range
+
+# bytes of commands each worker reduces at a time
+CHUNK = 1 << 22
+
+# commands between trajectory checkpoints
+EVERY = 1024
+
+COMMANDS = ("forward", "down", "up")
 
 
 @dataclass
@@ -11,17 +30,165 @@ class Position:
         return self.horizontal * self.depth
 
 
-def read_file(path) -> list[str]:
-    with open(path, "r") as file:
-        return file.readlines()
+@dataclass(frozen=True)
+class Transform:
+    # what a run of commands does to a submarine starting at aim 0:
+    # (h, d, a) -> (h + horizontal, d + depth + a * horizontal, a + aim)
+    horizontal: int = 0
+    depth: int = 0
+    aim: int = 0
+
+    def then(self, other: Transform) -> Transform:
+        # associative, so runs can be reduced separately and combined in order
+        return Transform(
+            self.horizontal + other.horizontal,
+            self.depth + other.depth + self.aim * other.horizontal,
+            self.aim + other.aim,
+        )
+
+    @property
+    def position(self) -> Position:
+        return Position(self.horizontal, self.depth)
+
+    @property
+    def position_without_aim(self) -> Position:
+        # part 1 moves depth the way part 2 moves aim
+        return Position(self.horizontal, self.aim)
+
+
+def read_file(path) -> Iterator[str]:
+    return read_lines(path)
+
+
+def parse_instructions(raw_input: Iterable[str]) -> Iterator[tuple[str, int]]:
+    parsed_line = (line.split(" ") for line in raw_input)
+    return ((i[0], int(i[1])) for i in parsed_line)
+
+
+def reduce_commands(commands: Iterable[tuple[str, int]]) -> Transform:
+    horizontal = depth = aim = 0
+    for i, n in commands:
+        if i == "forward":
+            horizontal += n
+            depth += aim * n
+        elif i == "down":
+            aim += n
+        elif i == "up":
+            aim -= n
+        else:
+            raise ValueError(f"unknown command {i}")
+    return Transform(horizontal, depth, aim)
 
 
-def parse_instructions(raw_input: list[str]) -> list[tuple[str, int]]:
-    parsed_line = [line.split(" ") for line in raw_input]
-    return [(i[0], int(i[1])) for i in parsed_line]
+def reduce_range(path: str | os.PathLike, start: int, end: int) -> Transform:
+    words = read_range(path, start, end).decode().split()
+    return reduce_commands(zip(words[::2], map(int, words[1::2])))
 
 
-def part_1(input_lines: list[str]):
+def reduce_file(
+    path: str | os.PathLike, workers: int | None = None, chunk: int = CHUNK
+) -> Transform:
+    ranges = byte_ranges(path, chunk)
+    starts, ends = [s for s, _ in ranges], [e for _, e in ranges]
+    if workers == 1 or len(ranges) == 1:
+        parts = map(reduce_range, repeat(path), starts, ends)
+        return reduce(Transform.then, parts, Transform())
+    with ProcessPoolExecutor(workers) as pool:
+        parts = pool.map(reduce_range, repeat(path), starts, ends)
+        return reduce(Transform.then, parts, Transform())
+
+
+def blocks(items: Iterable, size: int) -> Iterator[list]:
+    items = iter(items)
+    while block := list(islice(items, size)):
+        yield block
+
+
+def command_lines(file: BinaryIO) -> Iterator[tuple[int, bytes]]:
+    # non-blank lines with the offset each starts at
+    offset = 0
+    for line in file:
+        if line.strip():
+            yield offset, line
+        offset += len(line)
+
+
+@dataclass
+class Trajectory:
+    # the state after every `every` commands as the transform from the start;
+    # any other step replays at most `every` commands from the checkpoint
+    # before it (every=1 answers in O(1) from the checkpoints alone)
+    every: int = EVERY
+    checkpoints: list[Transform] = field(default_factory=lambda: [Transform()])
+    length: int = 0
+
+    # commands kept in memory, or where each checkpoint starts in a file
+    kinds: bytearray = field(default_factory=bytearray)
+    amounts: array = field(default_factory=lambda: array("q"))
+    path: Path | None = None
+    offsets: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_commands(
+        cls, commands: Iterable[tuple[str, int]], every: int = EVERY
+    ) -> Trajectory:
+        trajectory = cls(every)
+        for block in blocks(commands, every):
+            trajectory.kinds.extend(COMMANDS.index(i) for i, _ in block)
+            trajectory.amounts.extend(n for _, n in block)
+            trajectory.add(block)
+        return trajectory
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike, every: int = EVERY) -> Trajectory:
+        # streaming: checkpoints are written as the file is parsed and only
+        # they are kept, queries re-read their last stretch from disk
+        trajectory = cls(every, path=Path(path))
+        with open(path, "rb") as file:
+            for block in blocks(command_lines(file), every):
+                trajectory.offsets.append(block[0][0])
+                trajectory.add(parse_instructions(line.decode() for _, line in block))
+        return trajectory
+
+    def add(self, block: Iterable[tuple[str, int]]) -> None:
+        block = list(block)
+        self.checkpoints.append(self.checkpoints[-1].then(reduce_commands(block)))
+        self.length += len(block)
+
+    def replay(self, checkpoint: int, count: int) -> Iterator[tuple[str, int]]:
+        start = checkpoint * self.every
+        if self.path is None:
+            kinds = self.kinds[start : start + count]
+            amounts = self.amounts[start : start + count]
+            return zip(map(COMMANDS.__getitem__, kinds), amounts)
+
+        with open(self.path, "rb") as file:
+            file.seek(self.offsets[checkpoint])
+            lines = list(islice(filter(bytes.strip, file), count))
+        return parse_instructions(line.decode() for line in lines)
+
+    def at(self, step: int) -> Transform:
+        # the state after the first `step` commands
+        if not 0 <= step <= self.length:
+            raise IndexError(f"step {step} outside 0..{self.length}")
+        checkpoint, rest = divmod(step, self.every)
+        state = self.checkpoints[checkpoint]
+        if rest:
+            state = state.then(reduce_commands(self.replay(checkpoint, rest)))
+        return state
+
+
+def part_1(input_lines: Iterable[str]):
+    transform = reduce_commands(parse_instructions(input_lines))
+    return transform.position_without_aim.result
+
+
+def part_2(input_lines: Iterable[str]):
+    transform = reduce_commands(parse_instructions(input_lines))
+    return transform.position.result
+
+
+def reference_part_1(input_lines: Iterable[str]):
 
     parsed_input = parse_instructions(input_lines)
     position = Position(0, 0)
@@ -39,7 +206,7 @@ def part_1(input_lines: list[str]):
     return position.result
 
 
-def part_2(input_lines: list[str]):
+def reference_part_2(input_lines: Iterable[str]):
     parsed_input = parse_instructions(input_lines)
     position = Position(0, 0)
 
@@ -59,6 +226,7 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
-    out = part_2(inp)
+    # python -m day02.main [file], reducing chunks on every core
+    path = sys.argv[1] if len(sys.argv) > 1 else Path(__file__).parent / "input.txt"
+    out = reduce_file(path).position.result
     print(out)
@@ -0,0 +1,11 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    count = 1000 * scale
+
+    # reduce_to_one needs unique lines, so widen the report as it grows
+    width = max(12, (count * 4).bit_length())
+    numbers = rng.sample(range(2**width), count)
+    return [f"{n:0{width}b}" for n in numbers]
@@ -1,22 +1,65 @@
-def read_file(path) -> list[str]:
-    with open(path, "r") as file:
-        return file.read().splitlines()
+from bisect import bisect_left
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
 
+from aoc import backend
+from aoc.reader import read_lines
 
-def bit_length(bits: list[str]) -> int:
-    return len(bits[0])
+
+# a bit criterion picks the digit kept from how many zeros and ones are left
+Criterion = Callable[[int, int], int]
+
+
+def read_file(path) -> Iterator[str]:
+    return read_lines(path)
 
 
 def bit_to_int(digits: list[int]) -> int:
     return int("".join(str(d) for d in digits), 2)
 
 
-def bit_counter(bit_lines: list[str]) -> list[dict[int, int]]:
-    bit_counter = [{0: 0, 1: 0} for _ in range(bit_length(bit_lines))]
-    for line in bit_lines:
-        for digit, bit in enumerate(line):
-            bit_counter[int(digit)][int(bit)] += 1
-    return bit_counter
+def bit_matrix(bit_lines: Iterable[str]):
+    # one row per line, one uint8 column per digit
+    lines = list(bit_lines)
+    digits = backend.np.frombuffer("".join(lines).encode(), dtype=backend.np.uint8)
+    return digits.reshape(len(lines), -1) - ord("0")
+
+
+def bit_counter(bit_lines: Iterable[str]) -> list[dict[int, int]]:
+    if backend.NUMPY:
+        matrix = bit_matrix(bit_lines)
+        rows = len(matrix)
+        return [{0: rows - ones, 1: ones} for ones in matrix.sum(axis=0).tolist()]
+
+    rows, ones = column_ones(bit_lines)
+    return [{0: rows - n, 1: n} for n in ones]
+
+
+def column_ones(bit_lines: Iterable[str]) -> tuple[int, list[int]]:
+    # every line is read once as an integer of any width and added into
+    # bit-sliced counters: bit c of slices[k] is bit k of column c's count,
+    # so a row costs a couple of word-wide xor/and carries, not a dict
+    # update per character
+    lines = iter(bit_lines)
+    first = next(lines)
+    width = len(first)
+    slices: list[int] = []
+    rows = 0
+    for line in chain([first], lines):
+        rows += 1
+        carry = int(line, 2)
+        k = 0
+        while carry:
+            if k == len(slices):
+                slices.append(carry)
+                break
+            slices[k], carry = slices[k] ^ carry, slices[k] & carry
+            k += 1
+
+    columns = range(width - 1, -1, -1)  # leftmost digit is the highest bit
+    ones = [sum((s >> c & 1) << k for k, s in enumerate(slices)) for c in columns]
+    return rows, ones
 
 
 def filter_by_common_digit(
@@ -47,7 +90,52 @@ def reduce_to_one(bit_options: list[str], criteria: str) -> str:
     return reduce_to_one(new_options, criteria)
 
 
-def part_1(input_lines: list[str]):
+def most_common(tie: int) -> Criterion:
+    return lambda zeros, ones: tie if zeros == ones else int(ones > zeros)
+
+
+def least_common(tie: int) -> Criterion:
+    return lambda zeros, ones: tie if zeros == ones else int(ones < zeros)
+
+
+OXYGEN = most_common(1)
+CO2 = least_common(0)
+
+
+def ratings(bit_lines: Iterable[str], criteria: Mapping[str, Criterion]) -> dict:
+    # sorted once, the numbers sharing a prefix are a contiguous range and
+    # the ones with a 1 at the next digit are its upper part, so every
+    # filter step is one binary search; all criteria share the sort
+    lines = list(bit_lines)
+    width = len(lines[0])
+    values = sorted_values(lines)
+
+    found = {}
+    for name, criterion in criteria.items():
+        lo, hi = 0, len(values)
+        for shift in range(width - 1, -1, -1):
+            if hi - lo == 1:
+                break
+            prefix = values[lo] >> (shift + 1) << (shift + 1)
+            split = bisect_left(values, prefix | 1 << shift, lo, hi)
+            zeros, ones = split - lo, hi - split
+            if zeros and ones:
+                lo, hi = (split, hi) if criterion(zeros, ones) else (lo, split)
+        found[name] = int(values[lo])
+    return found
+
+
+def sorted_values(lines: list[str]):
+    # numpy packs and sorts the report while a line fits in an int64
+    width = len(lines[0])
+    if backend.NUMPY and width < 64:
+        np = backend.np
+        weights = np.left_shift(1, np.arange(width - 1, -1, -1, dtype=np.int64))
+        return np.sort(bit_matrix(lines).astype(np.int64) @ weights)
+    return sorted(int(line, 2) for line in lines)
+
+
+def part_1(input_lines: Iterable[str]):
 
     common_bits = bit_counter(input_lines)
 
@@ -57,8 +145,30 @@ def part_1(input_lines: list[str]):
     return gamma * epsilon
 
 
-def part_2(input_lines: list[str]):
+def reference_part_1(input_lines: Iterable[str]):
+
+    lines = list(input_lines)
+    counter = [{0: 0, 1: 0} for _ in range(len(lines[0]))]
+    for line in lines:
+        for digit, bit in enumerate(line):
+            counter[digit][int(bit)] += 1
+
+    gamma = bit_to_int([0 if b[0] > b[1] else 1 for b in counter])
+    epsilon = bit_to_int([1 if b[0] > b[1] else 0 for b in counter])
+
+    return gamma * epsilon
+
+
+def part_2(input_lines: Iterable[str]):
+
+    found = ratings(input_lines, {"oxygen": OXYGEN, "co2": CO2})
+    return found["oxygen"] * found["co2"]
+
+
+def reference_part_2(input_lines: Iterable[str]):
 
+    # both ratings filter the full report, so it has to be held in memory
+    input_lines = list(input_lines)
     oxygen = int(reduce_to_one(input_lines, "oxygen"), 2)
     co2 = int(reduce_to_one(input_lines, "co2"), 2)
 
@@ -66,6 +176,6 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
+    inp = read_file(Path(__file__).parent / "input.txt")
     out = part_2(inp)
     print(out)
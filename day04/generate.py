@@ -0,0 +1,15 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    draws = rng.sample(range(100), 100)
+    lines = [",".join(str(d) for d in draws)]
+
+    for _ in range(100 * scale):
+        numbers = rng.sample(range(100), 25)
+        lines.append("")
+        for row in range(5):
+            lines.append(" ".join(f"{n:2}" for n in numbers[row * 5 : row * 5 + 5]))
+    return lines
@@ -1,4 +1,9 @@
-from dataclasses import dataclass
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc import backend
 
 
 @dataclass
@@ -48,20 +53,119 @@ class Board:
 class Boards:
     raw_input: list[str]
 
+    # every number of every board in reading order, parsed once; board b is
+    # cells[25 * b : 25 * b + 25] and Board objects are only built when asked for
+    cells: array = field(init=False, repr=False)
+    views: dict[int, Board] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        self.cells = array("H", map(int, " ".join(self.raw_input).split()))
+
+    def __len__(self) -> int:
+        return len(self.cells) // 25
+
     @property
-    def flat_boards(self):
-        return [
-            [int(n) for n in line.split(" ") if n != ""]
-            for line in self.raw_input
-            if line != ""
-        ]
+    def flat_boards(self) -> list[list[int]]:
+        return [self.cells[i : i + 5].tolist() for i in range(0, len(self.cells), 5)]
 
     @property
     def boards(self) -> list[Board]:
-        return [Board(list(i)) for i in zip(*[iter(self.flat_boards)] * 5)]
+        return [self.board(n) for n in range(len(self))]
 
     def board(self, n: int) -> Board:
-        return self.boards[n]
+        n = range(len(self))[n]
+        if n not in self.views:
+            start = 25 * n
+            rows = range(start, start + 25, 5)
+            self.views[n] = Board([self.cells[i : i + 5].tolist() for i in rows])
+        return self.views[n]
+
+    def ndarray(self):
+        # zero-copy (boards, 5, 5) view, numpy backend only
+        view = backend.np.frombuffer(self.cells, dtype=backend.np.uint16)
+        return view.reshape(len(self), 5, 5)
+
+
+class Bingo:
+    # every number knows the cells it sits in, and each board keeps hit
+    # counts per row and column plus the sum of its unmarked numbers, so a
+    # draw only touches the cells holding it and a win is a counter hitting 5
+    def __init__(self, boards: Boards):
+        self.count = len(boards)
+        self.cells: dict[int, list[tuple[int, int, int]]] = defaultdict(list)
+        for k, number in enumerate(boards.cells):
+            b, cell = divmod(k, 25)
+            self.cells[number].append((b, *divmod(cell, 5)))
+
+        self.row_hits = array("b", [0]) * (5 * self.count)
+        self.col_hits = array("b", [0]) * (5 * self.count)
+        cells = boards.cells
+        totals = (sum(cells[k : k + 25]) for k in range(0, len(cells), 25))
+        self.unmarked = array("q", totals)
+        self.won = bytearray(self.count)
+
+    def draw(self, number: int) -> list[int]:
+        # boards winning with this number, in board order
+        winners = []
+        for b, i, j in self.cells.get(number, ()):
+            self.unmarked[b] -= number
+            self.row_hits[5 * b + i] += 1
+            self.col_hits[5 * b + j] += 1
+            if self.won[b]:
+                continue
+            if self.row_hits[5 * b + i] == 5 or self.col_hits[5 * b + j] == 5:
+                self.won[b] = 1
+                winners.append(b)
+        return winners
+
+    def final_score(self, board: int, number: int) -> int:
+        return self.unmarked[board] * number
+
+
+@dataclass
+class Win:
+    board: int
+    turn: int  # index of the winning draw
+    number: int
+    score: int
+
+
+def win_ranking(draws: list[int], boards: Boards) -> list[Win]:
+    # a line is complete at the latest draw among its numbers and a board
+    # wins with its earliest complete line, so every win turn comes straight
+    # from the draw order; boards that never win are left out
+    never = len(draws)
+    order = {}
+    for turn, number in enumerate(draws):
+        order.setdefault(number, turn)
+
+    if backend.NUMPY:
+        turns, scores = win_turns_numpy(order, never, boards)
+    else:
+        turns, scores = [], []
+        for start in range(0, len(boards.cells), 25):
+            cells = boards.cells[start : start + 25]
+            lines = [cells[i : i + 5] for i in range(0, 25, 5)]
+            lines += [cells[j::5] for j in range(5)]
+            turn = min(max(order.get(n, never) for n in line) for line in lines)
+            unmarked = sum(n for n in cells if order.get(n, never) > turn)
+            turns.append(turn)
+            scores.append(unmarked)
+
+    ranking = sorted((turn, b) for b, turn in enumerate(turns) if turn < never)
+    return [Win(b, t, draws[t], scores[b] * draws[t]) for t, b in ranking]
+
+
+def win_turns_numpy(order: dict[int, int], never: int, boards: Boards):
+    np = backend.np
+    layout = boards.ndarray()
+    lookup = np.full(max(max(order, default=0), int(layout.max())) + 1, never)
+    lookup[list(order)] = list(order.values())
+
+    turns = lookup[layout]
+    win = np.minimum(turns.max(axis=2).min(axis=1), turns.max(axis=1).min(axis=1))
+    unmarked = np.where(turns > win[:, None, None], layout, 0).sum(axis=(1, 2))
+    return win.tolist(), unmarked.tolist()
 
 
 def read_file(path) -> list[str]:
@@ -70,6 +174,18 @@ def read_file(path) -> list[str]:
 
 
 def part_1(input_lines: list[str]):
+    draws = Draws(input_lines[0]).draws
+    ranking = win_ranking(draws, Boards(input_lines[2:]))
+    return ranking[0].score
+
+
+def part_2(input_lines: list[str]):
+    draws = Draws(input_lines[0]).draws
+    ranking = win_ranking(draws, Boards(input_lines[2:]))
+    return ranking[-1].score
+
+
+def reference_part_1(input_lines: list[str]):
 
     draws = Draws(input_lines[0]).draws
     boards = Boards(input_lines[2:]).boards
@@ -89,7 +205,7 @@ def part_1(input_lines: list[str]):
     return boards[winners[0]].final_score(final_draw)
 
 
-def part_2(input_lines: list[str]):
+def reference_part_2(input_lines: list[str]):
     draws = Draws(input_lines[0]).draws
     boards = Boards(input_lines[2:]).boards
 
@@ -111,6 +227,8 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
-    out = part_2(inp)
-    print(out)
+    # every board that wins, in the order it does
+    inp = read_file(Path(__file__).parent / "input.txt")
+    draws = Draws(inp[0]).draws
+    for rank, win in enumerate(win_ranking(draws, Boards(inp[2:])), 1):
+        print(f"{rank:>4} board {win.board:>4} turn {win.turn:>3} score {win.score}")
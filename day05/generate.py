@@ -0,0 +1,28 @@
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    # keep the vent density of the puzzle by growing the map with the line count
+    size = int(1000 * math.sqrt(scale))
+    lines = []
+    for _ in range(500 * scale):
+        x1, y1 = rng.randrange(size), rng.randrange(size)
+        kind = rng.choice(["vertical", "horizontal", "diagonal"])
+        if kind == "vertical":
+            x2, y2 = x1, rng.randrange(size)
+        elif kind == "horizontal":
+            x2, y2 = rng.randrange(size), y1
+        else:
+            length = rng.randint(-min(x1, y1), size - 1 - max(x1, y1))
+            sign = rng.choice([-1, 1])
+            x2 = x1 + length
+            y2 = y1 + sign * length
+            if not 0 <= y2 < size:
+                y2 = y1 - sign * length
+            if not 0 <= y2 < size:
+                x2, y2 = x1, y1
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+    return lines
@@ -1,5 +1,22 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from itertools import combinations
+import math
+from typing import Iterator
+
+from aoc import backend
+
+# largest map counted in a flat array of one byte per cell
+DENSE = 1 << 24
+
+# most cells kept one by one on bigger maps before lines are swept instead;
+# a set costs tens of bytes a cell, so this stays well inside the budget
+RASTER = 1 << 20
+
+# a cell's count after one more line, stopping at 2 (an intersection)
+BUMP = bytes([1, 2, 2]) + bytes(253)
 
 
 class Direction(Enum):
@@ -9,6 +26,19 @@ class Direction(Enum):
     DESC = "descending"
 
 
+# every family of parallel lines is the set of lines a * x + b * y = key;
+# cells along one are told apart by their x (their y on vertical lines)
+KEYS = {
+    Direction.HORZ: (0, 1),
+    Direction.VERT: (1, 0),
+    Direction.DESC: (1, -1),
+    Direction.ASC: (1, 1),
+}
+
+# inclusive range of positions along a line
+Run = tuple[int, int]
+
+
 @dataclass
 class Vector:
     x: int
@@ -91,11 +121,11 @@ class SurfaceMap:
                 line for line in self.vent_lines if self.valid_line(line)
             ]
 
-        max_x = max(line.max_x for line in self.vent_lines)
-        max_y = max(line.max_y for line in self.vent_lines)
-        self.map = [[0 for _ in range(max_x + 1)] for _ in range(max_y + 1)]
+        self.width = max(line.max_x for line in self.vent_lines) + 1
+        self.height = max(line.max_y for line in self.vent_lines) + 1
 
     def draw_map(self):
+        self.map = [[0 for _ in range(self.width)] for _ in range(self.height)]
 
         for line in self.vent_lines:
 
@@ -139,8 +169,75 @@ class SurfaceMap:
                 y = loc[1]
                 self.map[y][x] += 1
 
+    def vent_cells(self, line: Line) -> range:
+        # flat index y * width + x of every cell along the line
+        dx = (line.end.x > line.start.x) - (line.end.x < line.start.x)
+        dy = (line.end.y > line.start.y) - (line.end.y < line.start.y)
+        start = line.start.y * self.width + line.start.x
+        stride = dy * self.width + dx
+        if stride == 0:
+            return range(start, start + 1)
+        length = max(line.max_x - line.min_x, line.max_y - line.min_y) + 1
+        return range(start, start + length * stride, stride)
+
+    def vent_slice(self, line: Line) -> slice:
+        # the same cells as a slice of the flat map, walked upwards
+        cells = self.vent_cells(line)
+        step = abs(cells.step)
+        low = min(cells[0], cells[-1])
+        return slice(low, low + len(cells) * step, step)
+
+    @property
+    def cell_count(self) -> int:
+        return sum(
+            max(line.max_x - line.min_x, line.max_y - line.min_y) + 1
+            for line in self.vent_lines
+        )
+
     @property
     def intersections(self) -> int:
+        if self.width * self.height <= DENSE:
+            return self.flat_intersections
+        if self.cell_count <= RASTER:
+            return self.sparse_intersections
+        return self.swept_intersections
+
+    @property
+    def flat_intersections(self) -> int:
+        # every line bumps its strided slice of the map, capped at 2; the
+        # slicing and translate run in C, so numpy has nothing to add here
+        flat = bytearray(self.width * self.height)
+        for line in self.vent_lines:
+            cells = self.vent_slice(line)
+            flat[cells] = flat[cells].translate(BUMP)
+        return flat.count(2)
+
+    @property
+    def sparse_intersections(self) -> int:
+        # only the cells lines pass through are stored, so the map size does
+        # not matter; a line never crosses itself, so a cell it shares with
+        # earlier lines is an intersection
+        if backend.NUMPY:
+            np = backend.np
+            slices = [self.vent_slice(line) for line in self.vent_lines]
+            cells = np.concatenate([np.arange(s.start, s.stop, s.step) for s in slices])
+            _, counts = np.unique(cells, return_counts=True)
+            return int(np.count_nonzero(counts > 1))
+
+        covered: set[int] = set()
+        crossed: set[int] = set()
+        for line in self.vent_lines:
+            cells = self.vent_cells(line)
+            crossed.update(covered.intersection(cells))
+            covered.update(cells)
+        return len(crossed)
+
+    @property
+    def swept_intersections(self) -> int:
+        return sweep_intersections(self.vent_lines)
+
+    @property
+    def dense_intersections(self) -> int:
         self.draw_map()
 
         intersections = 0
@@ -151,6 +248,124 @@ class SurfaceMap:
         return intersections
 
 
+def line_run(line: Line) -> tuple[Direction, int, Run]:
+    direction = line.direction
+    a, b = KEYS[direction]
+    key = a * line.start.x + b * line.start.y
+    if direction == Direction.VERT:
+        return direction, key, (line.min_y, line.max_y)
+    return direction, key, (line.min_x, line.max_x)
+
+
+def cell(direction: Direction, key: int, position: int) -> tuple[int, int]:
+    if direction == Direction.HORZ:
+        return position, key
+    if direction == Direction.VERT:
+        return key, position
+    if direction == Direction.DESC:
+        return position, position - key
+    return position, key - position
+
+
+def cell_position(direction: Direction, x: int, y: int) -> int:
+    return y if direction == Direction.VERT else x
+
+
+def coverage(runs: list[Run]) -> tuple[list[Run], list[Run]]:
+    # positions covered at least once and at least twice by runs on one line
+    events = sorted([(lo, 1) for lo, _ in runs] + [(hi + 1, -1) for _, hi in runs])
+    once: list[Run] = []
+    twice: list[Run] = []
+    depth, previous = 0, 0
+    for position, change in events:
+        if position > previous:
+            for merged, needed in ((once, 1), (twice, 2)):
+                if depth < needed:
+                    continue
+                if merged and merged[-1][1] == previous - 1:
+                    merged[-1] = (merged[-1][0], position - 1)
+                else:
+                    merged.append((previous, position - 1))
+        depth += change
+        previous = position
+    return once, twice
+
+
+def inside(runs: list[Run], position: int) -> bool:
+    i = bisect_right(runs, (position, math.inf)) - 1
+    return i >= 0 and runs[i][0] <= position <= runs[i][1]
+
+
+def crossings(
+    covered: dict[tuple[Direction, int], list[Run]],
+    first: Direction,
+    second: Direction,
+) -> Iterator[tuple[int, int]]:
+    # cells where a run of the first family meets one of the second: sweep
+    # along the second family's key, keeping the first family's lines that
+    # span it sorted by key, and look up the ones each second run passes
+    (a1, b1), (a2, b2) = KEYS[first], KEYS[second]
+    det = a1 * b2 - a2 * b1
+    # both diagonals only meet where x - y and x + y share their parity
+    step = abs(det)
+
+    def span(direction, key, run, a, b):
+        ends = [cell(direction, key, position) for position in run]
+        return sorted(a * x + b * y for x, y in ends)
+
+    events = []
+    for (direction, key), runs in covered.items():
+        for run in runs:
+            if direction == first:
+                lo, hi = span(direction, key, run, a2, b2)
+                events += [(lo, 0, key), (hi, 2, key)]
+            elif direction == second:
+                events.append((key, 1, span(direction, key, run, a1, b1)))
+    events.sort(key=lambda event: event[:2])
+
+    active: dict[int, list[int]] = defaultdict(list)
+    for position, kind, value in events:
+        keys = active[position % step] if kind == 1 else active[value % step]
+        if kind == 0:
+            insort(keys, value)
+        elif kind == 2:
+            keys.pop(bisect_left(keys, value))
+        else:
+            lo, hi = value
+            for key in keys[bisect_left(keys, lo) : bisect_right(keys, hi)]:
+                x = (key * b2 - position * b1) // det
+                y = (a1 * position - a2 * key) // det
+                yield x, y
+
+
+def sweep_intersections(lines: list[Line]) -> int:
+    # works from the lines' end points alone: overlaps between lines on the
+    # same key are merged runs, and cells shared by lines of different
+    # families are crossings of those runs, so the work grows with the
+    # number of lines and intersections rather than with the map area
+    runs = defaultdict(list)
+    for line in lines:
+        direction, key, run = line_run(line)
+        runs[direction, key].append(run)
+
+    covered, overlaps = {}, {}
+    for group, group_runs in runs.items():
+        covered[group], overlaps[group] = coverage(group_runs)
+    count = sum(hi - lo + 1 for merged in overlaps.values() for lo, hi in merged)
+
+    crossed = set()
+    for first, second in combinations(KEYS, 2):
+        crossed.update(crossings(covered, first, second))
+
+    # a crossing that also lies on a collinear overlap was counted there too
+    for x, y in crossed:
+        for direction, (a, b) in KEYS.items():
+            merged = overlaps.get((direction, a * x + b * y))
+            if merged and inside(merged, cell_position(direction, x, y)):
+                count -= 1
+    return count + len(crossed)
+
+
 def read_file(path) -> list[str]:
     with open(path, "r") as file:
         return file.read().splitlines()
@@ -166,6 +381,16 @@ def part_2(input_lines: list[str]):
     return surface_map.intersections
 
 
+def reference_part_1(input_lines: list[str]):
+    surface_map = SurfaceMap(input_lines, diagonal=False)
+    return surface_map.dense_intersections
+
+
+def reference_part_2(input_lines: list[str]):
+    surface_map = SurfaceMap(input_lines, diagonal=True)
+    return surface_map.dense_intersections
+
+
 if __name__ == "__main__":
     inp = read_file("input.txt")
     out = part_2(inp)
@@ -0,0 +1,6 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [",".join(str(rng.randint(1, 5)) for _ in range(300 * scale))]
@@ -0,0 +1,6 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [",".join(str(int(rng.expovariate(1 / 400))) for _ in range(1000 * scale))]
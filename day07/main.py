@@ -1,3 +1,6 @@
+from aoc import backend
+
+
 def read_file(path) -> list[str]:
     with open(path, "r") as file:
         return file.read().splitlines()
@@ -7,9 +10,28 @@ def parse_input(input: list[str]) -> list[int]:
     return [int(i) for i in input[0].split(",")]
 
 
+def min_fuel_numpy(crabs: list[int], triangular: bool) -> int:
+    np = backend.np
+    positions = np.array(crabs, dtype=np.int64)
+    targets = np.arange(positions.min(), positions.max() + 1)
+
+    # a block of targets at a time keeps the distance matrix near 8 MiB
+    block = max(1, 2**20 // len(positions))
+    costs = []
+    for start in range(0, len(targets), block):
+        distance = np.abs(positions[:, None] - targets[None, start : start + block])
+        if triangular:
+            distance = distance * (distance + 1) // 2
+        costs.append(distance.sum(axis=0).min())
+    return int(min(costs))
+
+
 def part_1(input_lines: list[str]):
 
     crabs = parse_input(input_lines)
+    if backend.NUMPY:
+        return min_fuel_numpy(crabs, triangular=False)
+
     available_pos = range(min(crabs), max(crabs) + 1)
     fuel_cost = {i: 0 for i in available_pos}
 
@@ -23,6 +45,9 @@ def part_1(input_lines: list[str]):
 def part_2(input_lines: list[str]):
 
     crabs = parse_input(input_lines)
+    if backend.NUMPY:
+        return min_fuel_numpy(crabs, triangular=True)
+
     available_pos = range(min(crabs), max(crabs) + 1)
     fuel_cost = {i: 0 for i in available_pos}
 
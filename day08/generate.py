@@ -0,0 +1,32 @@
+import random
+
+SEGMENTS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def scramble(rng: random.Random, wiring: dict[str, str], digit: int) -> str:
+    segments = [wiring[s] for s in SEGMENTS[digit]]
+    rng.shuffle(segments)
+    return "".join(segments)
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    lines = []
+    for _ in range(200 * scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        signals = [scramble(rng, wiring, d) for d in rng.sample(range(10), 10)]
+        values = [scramble(rng, wiring, rng.randrange(10)) for _ in range(4)]
+        lines.append(f"{' '.join(signals)} | {' '.join(values)}")
+    return lines
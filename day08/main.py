@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
 
+from aoc.reader import read_lines
 
-def read_file(path) -> list[str]:
-    with open(path, "r") as file:
-        return file.read().splitlines()
+
+def read_file(path) -> Iterator[str]:
+    return read_lines(path)
 
 
 @dataclass
@@ -37,17 +40,15 @@ class ParsedInput:
     output_values: list[str]
 
 
-def parse_lines(input: list[str]) -> list[ParsedInput]:
-    out = []
+def parse_lines(input: Iterable[str]) -> Iterator[ParsedInput]:
     for i in input:
         signals, values = i.split("|")
         signals_list = [s for s in signals.split(" ") if s != ""]
         values_list = [v for v in values.split(" ") if v != ""]
-        out.append(ParsedInput(signals_list, values_list))
-    return out
+        yield ParsedInput(signals_list, values_list)
 
 
-def part_1(input_lines: list[str]):
+def part_1(input_lines: Iterable[str]):
 
     parsed_lines = parse_lines(input_lines)
 
@@ -144,7 +145,7 @@ class DigitParser:
         return int("".join(out))
 
 
-def part_2(input_lines: list[str]):
+def part_2(input_lines: Iterable[str]):
 
     parsed_lines = parse_lines(input_lines)
 
@@ -160,6 +161,6 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
+    inp = read_file(Path(__file__).parent / "input.txt")
     out = part_2(inp)
     print(out)
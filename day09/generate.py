@@ -0,0 +1,44 @@
+from collections import deque
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    size = int(100 * math.sqrt(scale))
+    cells = size * size
+
+    # grow basins outwards from random low points, walled off by ridges of 9
+    owner = [-1] * cells
+    height = [0] * cells
+    queue = deque()
+    for basin, cell in enumerate(rng.sample(range(cells), max(1, cells // 60))):
+        owner[cell] = basin
+        queue.append(cell)
+
+    while queue:
+        cell = queue.popleft()
+        y, x = divmod(cell, size)
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if not (0 <= nx < size and 0 <= ny < size):
+                continue
+            n = ny * size + nx
+            if owner[n] != -1:
+                continue
+            owner[n] = owner[cell]
+            height[n] = min(8, height[cell] + rng.randint(1, 2))
+            queue.append(n)
+
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            cell = y * size + x
+            ridge = height[cell] > 0 and any(
+                owner[ny * size + nx] > owner[cell]
+                for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                if 0 <= nx < size and 0 <= ny < size
+            )
+            row.append("9" if ridge else str(height[cell]))
+        rows.append("".join(row))
+    return rows
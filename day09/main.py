@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 import math
+from pathlib import Path
+
+from aoc import backend
+from aoc.grid import Grid
 
 
 def read_file(path) -> list[str]:
@@ -7,145 +11,79 @@ def read_file(path) -> list[str]:
         return file.read().splitlines()
 
 
-@dataclass(slots=True)
-class Vector:
-    x: int
-    y: int
-
-    @property
-    def location(self) -> str:
-        return f"{self.x}|{self.y}"
-
-    def __eq__(self, __o: object) -> bool:
-        if isinstance(__o, Vector):
-            return (self.x == __o.x) and (self.y == __o.y)
-        return False
-
-
 @dataclass
 class FloorMap:
-    height_map: list[list[int]]
+    height_map: Grid
 
     def __post_init__(self):
-        self.basins = {v.location: [v] for v in self.low_points}
+        self.basins = {i: [i] for i in self.low_points}
 
     @property
     def height(self) -> int:
-        return len(self.height_map)
+        return self.height_map.height
 
     @property
     def width(self) -> int:
-        return len(self.height_map[0])
-
-    @property
-    def vectors(self) -> list[Vector]:
-        return [
-            Vector(x, y) for x in range(self.width) for y in range(self.height)
-        ]  # noqa
+        return self.height_map.width
 
     @property
-    def low_points(self) -> list[Vector]:
-        return [v for v in self.vectors if self.is_lowpoint(v)]
+    def low_points(self) -> list[int]:
+        if backend.NUMPY:
+            return self.low_points_numpy()
+        return [i for i in range(self.height_map.size) if self.is_lowpoint(i)]
+
+    def low_points_numpy(self) -> list[int]:
+        # pad with a wall higher than any height so edges compare like the rest
+        heights = self.height_map.ndarray()
+        padded = backend.np.pad(heights, 1, constant_values=10)
+        low = (
+            (heights < padded[:-2, 1:-1])
+            & (heights < padded[2:, 1:-1])
+            & (heights < padded[1:-1, :-2])
+            & (heights < padded[1:-1, 2:])
+        )
+        return backend.np.flatnonzero(low).tolist()
 
     @property
     def risk_level(self) -> int:
-        return sum([self.get_vector_height(v) + 1 for v in self.low_points])
-
-    def get_vector_height(self, pos: Vector) -> int:
-        return self.height_map[pos.y][pos.x]
-
-    def is_lowpoint(self, pos: Vector) -> bool:
+        return sum([self.get_height(i) + 1 for i in self.low_points])
 
-        adj = self.get_adj(pos)
-        pos_height = self.get_vector_height(pos)
-        adj_height = [self.get_vector_height(a) for a in adj]
+    def get_height(self, index: int) -> int:
+        return self.height_map.cells[index]
 
-        return pos_height < min(adj_height)
+    def is_lowpoint(self, index: int) -> bool:
+        cells = self.height_map.cells
+        pos_height = cells[index]
+        return all(pos_height < cells[a] for a in self.height_map.neighbors4(index))
 
-    def is_ridge(self, pos: Vector) -> bool:
-        return True if self.get_vector_height(pos) == 9 else False
+    def is_ridge(self, index: int) -> bool:
+        return self.get_height(index) == 9
 
     def find_basins(self) -> None:
-        while True:
-            start_len = sum(len(b) for b in self.basins.values())
-            new_len = self.expand_basins()
-            if start_len == new_len:
-                break
-
-    def expand_basins(self) -> int:
-
-        for origin, basin in self.basins.items():
-            for vector in basin:
-                valid_vectors = [
-                    v for v in self.get_adj(vector) if not self.is_ridge(v)
-                ]
-                for v in valid_vectors:
-                    if v in basin:
-                        continue
-                    if self.is_ridge(v):
-                        continue
-                    self.basins[origin].append(v)
-        return sum([len(b) for b in self.basins.values()])
-
-    def get_adj(self, pos: Vector) -> list[Vector]:
-        if pos == Vector(0, 0):
-            return [
-                Vector(pos.x + 1, pos.y),
-                Vector(pos.x, pos.y + 1),
-            ]
-        if pos == Vector(0, self.height - 1):
-            return [
-                Vector(pos.x + 1, pos.y),
-                Vector(pos.x, pos.y - 1),
-            ]
-        if pos == Vector(self.width - 1, 0):
-            return [
-                Vector(pos.x - 1, pos.y),
-                Vector(pos.x, pos.y + 1),
-            ]
-        if pos == Vector(self.width - 1, self.height - 1):
-            return [
-                Vector(pos.x - 1, pos.y),
-                Vector(pos.x, pos.y - 1),
-            ]
-        if pos.x == 0:
-            return [
-                Vector(pos.x + 1, pos.y),
-                Vector(pos.x, pos.y - 1),
-                Vector(pos.x, pos.y + 1),
-            ]
-        if pos.x == self.width - 1:
-            return [
-                Vector(pos.x - 1, pos.y),
-                Vector(pos.x, pos.y - 1),
-                Vector(pos.x, pos.y + 1),
-            ]
-        if pos.y == 0:
-            return [
-                Vector(pos.x - 1, pos.y),
-                Vector(pos.x + 1, pos.y),
-                Vector(pos.x, pos.y + 1),
-            ]
-        if pos.y == self.height - 1:
-            return [
-                Vector(pos.x - 1, pos.y),
-                Vector(pos.x + 1, pos.y),
-                Vector(pos.x, pos.y - 1),
-            ]
-        return [
-            Vector(pos.x - 1, pos.y),
-            Vector(pos.x + 1, pos.y),
-            Vector(pos.x, pos.y - 1),
-            Vector(pos.x, pos.y + 1),
-        ]
+        for origin in self.basins:
+            self.basins[origin] = self.expand_basin(origin)
+
+    def expand_basin(self, origin: int) -> list[int]:
+
+        # flood fill everything reachable from the low point without
+        # crossing a ridge
+        basin = [origin]
+        seen = {origin}
+        for index in basin:
+            for n in self.height_map.neighbors4(index):
+                if n in seen or self.is_ridge(n):
+                    continue
+                seen.add(n)
+                basin.append(n)
+        return basin
 
     def print(self) -> None:
-        for row in self.height_map:
-            print(row)
+        for row in self.height_map.rows():
+            print(list(row))
 
 
 def parse_input(input: list[str]) -> FloorMap:
-    return FloorMap([[int(loc) for loc in row] for row in input])
+    return FloorMap(Grid.from_digits(input))
 
 
 def part_1(input_lines: list[str]):
@@ -164,6 +102,6 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
+    inp = read_file(Path(__file__).parent / "input.txt")
     out = part_2(inp)
     print(out)
@@ -0,0 +1,30 @@
+import random
+
+PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate_line(rng: random.Random, length: int, corrupted: bool) -> str:
+    line: list[str] = []
+    open_chars: list[str] = []
+    corrupt_at = rng.randrange(length // 2, length) if corrupted else -1
+
+    for i in range(length):
+        if i == corrupt_at and open_chars:
+            wrong = [c for c in PAIRS.values() if c != PAIRS[open_chars[-1]]]
+            line.append(rng.choice(wrong))
+            break
+        if len(open_chars) > 1 and rng.random() < 0.45:
+            line.append(PAIRS[open_chars.pop()])
+        else:
+            open_chars.append(rng.choice(list(PAIRS)))
+            line.append(open_chars[-1])
+
+    return "".join(line)
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        generate_line(rng, rng.randint(90, 110), rng.random() < 0.5)
+        for _ in range(110 * scale)
+    ]
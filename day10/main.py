@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
 
+from aoc.reader import read_lines
 
-def read_file(path) -> list[str]:
-    with open(path, "r") as file:
-        return file.read().splitlines()
+
+def read_file(path) -> Iterator[str]:
+    return read_lines(path)
 
 
 @dataclass
@@ -82,7 +85,7 @@ class LineParser:
         return "".join(missing_chars)
 
 
-def part_1(input_lines: list[str]):
+def part_1(input_lines: Iterable[str]):
     errors_found: list[str] = []
     for line in input_lines:
         parsed_line = LineParser(line)
@@ -94,7 +97,7 @@ def part_1(input_lines: list[str]):
     return score.corrupted_score
 
 
-def part_2(input_lines: list[str]):
+def part_2(input_lines: Iterable[str]):
     errors_found = []
     for line in input_lines:
         parsed_line = LineParser(line)
@@ -108,6 +111,6 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
+    inp = read_file(Path(__file__).parent / "input.txt")
     out = part_2(inp)
     print(out)
@@ -0,0 +1,39 @@
+import math
+import random
+
+from day11.main import FloorMap, load_octupusi
+
+# big uniformly random grids almost never synchronise, which would leave
+# part 2 looping forever; sparser grids (mostly zeros) do, so try denser
+# grids first and keep the first one that syncs within MAX_STEPS
+DENSITIES = (1.0, 1.0, 0.3, 0.3, 0.1, 0.1, 0.03)
+MAX_STEPS = 500
+
+
+def synchronises(lines: list[str]) -> bool:
+    floor_map = FloorMap(load_octupusi(lines))
+    for _ in range(MAX_STEPS):
+        floor_map.take_step()
+        floor_map.end_step()
+        if floor_map.step_count == floor_map.octopusi.size:
+            return True
+    return False
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    size = int(10 * math.sqrt(scale))
+
+    for density in DENSITIES:
+        lines = [
+            "".join(
+                str(rng.randrange(10)) if rng.random() < density else "0"
+                for _ in range(size)
+            )
+            for _ in range(size)
+        ]
+        if synchronises(lines):
+            return lines
+
+    # a uniform grid flashes all at once
+    return [str(rng.randrange(10)) * size for _ in range(size)]
@@ -1,113 +1,80 @@
 from dataclasses import dataclass
+from pathlib import Path
 
-
-@dataclass(slots=True)
-class Vector:
-    x: int
-    y: int
-
-    def __eq__(self, __o: object) -> bool:
-        if isinstance(__o, Vector):
-            return (self.x == __o.x) and (self.y == __o.y)
-        return False
-
-    def __str__(self) -> str:
-        return f"({self.x}, {self.y})"
-
-
-@dataclass
-class Octopus:
-    energy: int
-    location: Vector
-    flashed: bool
-
-    @property
-    def neighbors(self) -> list[Vector]:
-        directions = [
-            Vector(x + self.location.x, y + self.location.y)
-            for x in range(-1, 2)
-            for y in range(-1, 2)
-            if (x, y) != (0, 0)  # noqa
-        ]
-        return [d for d in directions]
+from aoc import backend
+from aoc.grid import DIAGONAL, ORTHOGONAL, Grid
 
 
 @dataclass
 class FloorMap:
-    width: int
-    height: int
-    octopusi: list[Octopus]
+    octopusi: Grid
 
     def __post_init__(self):
         self.flash_count = 0
         self.step_count = 0
 
     @property
-    def vectors(self) -> list[Vector]:
-        return [
-            Vector(x, y) for x in range(self.width) for y in range(self.height)
-        ]  # noqa
-
-    def octopus(self, location) -> Octopus:
-        return [o for o in self.octopusi if o.location == location][0]
-
-    def get_neighbors(self, octopus: Octopus) -> list[Octopus]:
-        location = octopus.location
-        neighbors = [
-            Vector(x + location.x, y + location.y)
-            for x in range(-1, 2)
-            for y in range(-1, 2)
-            if (x, y) != (0, 0)  # noqa
-        ]
-        return [
-            self.octopus(neighbor)
-            for neighbor in neighbors
-            if (0 <= neighbor.x < self.width)
-            and (0 <= neighbor.y < self.height)  # noqa
-        ]
+    def width(self) -> int:
+        return self.octopusi.width
+
+    @property
+    def height(self) -> int:
+        return self.octopusi.height
 
     def print(self) -> None:
-        for y in range(self.height):
-            print([o.energy for o in self.octopusi if o.location.y == y])
+        for row in self.octopusi.rows():
+            print(list(row))
         print("")
 
     def take_step(self) -> None:
 
-        # increase energy of all octopusi
-        for octopus in self.octopusi:
-            octopus.energy += 1
-
-        # set all octopusi with energery > 9 to flashed
-        flashed = [octopus for octopus in self.octopusi if octopus.energy > 9]
-        for octopus in flashed:
-            octopus.flashed = True
+        if backend.NUMPY:
+            return self.take_step_numpy()
 
-        # calculate flash impact to neighbors
-        for octopus in flashed:
-            self.flash_neighbors(octopus)
+        # increase energy of all octopusi
+        self.octopusi.add(1)
+
+        # octopusi with energy > 9 flash, every flash reaching a neighbor
+        # can make it flash in turn
+        energy = self.octopusi.cells
+        flashing = self.octopusi.indices(lambda e: e > 9)
+        while flashing:
+            octopus = flashing.pop()
+            for neighbor in self.octopusi.neighbors8(octopus):
+                energy[neighbor] += 1
+                if energy[neighbor] == 10:
+                    flashing.append(neighbor)
+
+    def take_step_numpy(self) -> None:
+        np = backend.np
+        energy = self.octopusi.ndarray()
+        energy += 1
+
+        # every round flashes all newly charged octopusi at once, each one
+        # adding a shifted copy of the flash mask to its neighbors
+        h, w = self.height, self.width
+        flashed = np.zeros(energy.shape, dtype=bool)
+        flashing = energy > 9
+        while flashing.any():
+            flashed |= flashing
+            padded = np.pad(flashing, 1).astype(energy.dtype)
+            for dx, dy in ORTHOGONAL + DIAGONAL:
+                energy += padded[1 - dy : 1 - dy + h, 1 - dx : 1 - dx + w]
+            flashing = (energy > 9) & ~flashed
 
     def end_step(self) -> None:
-        self.step_count = 0
-        for octopus in self.octopusi:
-            if not octopus.flashed:
-                continue
-            octopus.energy = 0
-            octopus.flashed = False
-            self.flash_count += 1
-            self.step_count += 1
-
-    def flash_neighbors(self, octopus: Octopus) -> None:
-        neighbors = [n for n in self.get_neighbors(octopus) if not n.flashed]
-        if not neighbors:
+        if backend.NUMPY:
+            energy = self.octopusi.ndarray()
+            flashed = energy > 9
+            energy[flashed] = 0
+            self.step_count = int(flashed.sum())
+            self.flash_count += self.step_count
             return
-        for neighbor in neighbors:
-            if neighbor.flashed:
-                continue
-            neighbor.energy += 1
-            if neighbor.energy < 10:
-                continue
-            neighbor.flashed = True
-            self.flash_neighbors(neighbor)
+
+        flashed = self.octopusi.indices(lambda e: e > 9)
+        self.octopusi.put(flashed, 0)
+        self.step_count = len(flashed)
+        self.flash_count += self.step_count
 
 
 def read_file(path) -> list[str]:
@@ -115,19 +82,12 @@ def read_file(path) -> list[str]:
         return file.read().splitlines()
 
 
-def load_octupusi(input_lines: list[str]) -> list[Octopus]:
-
-    octupusi: list[Octopus] = []
-    for y, line in enumerate(input_lines):
-        for x, energy in enumerate(line):
-            octupusi.append(Octopus(int(energy), Vector(x, y), False))
-
-    return octupusi
+def load_octupusi(input_lines: list[str]) -> Grid:
+    return Grid.from_digits(input_lines)
 
 
 def part_1(input_lines: list[str]):
-    octupusi = load_octupusi(input_lines)
-    floor_map = FloorMap(10, 10, octupusi)
+    floor_map = FloorMap(load_octupusi(input_lines))
 
     for _ in range(100):
         floor_map.take_step()
@@ -137,11 +97,10 @@ def part_1(input_lines: list[str]):
 
 
 def part_2(input_lines: list[str]):
-    octupusi = load_octupusi(input_lines)
-    floor_map = FloorMap(10, 10, octupusi)
+    floor_map = FloorMap(load_octupusi(input_lines))
 
     i = 0
-    while floor_map.step_count != 100:
+    while floor_map.step_count != floor_map.octopusi.size:
         floor_map.take_step()
         floor_map.end_step()
         i += 1
@@ -150,6 +109,6 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
+    inp = read_file(Path(__file__).parent / "input.txt")
     octupusi = part_2(inp)
     print(octupusi)
@@ -0,0 +1,25 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    # every cluster only connects to start and end, so the path count grows
+    # linearly with the scale instead of exponentially
+    edges: list[str] = []
+    for n in range(scale):
+        small = [f"c{n * 4 + i}" for i in range(4)]
+        big = [f"C{n * 2 + i}" for i in range(2)]
+
+        for cave in big:
+            for other in rng.sample(small, 2):
+                edges.append(f"{cave}-{other}")
+        for a, b in zip(small, small[1:]):
+            edges.append(f"{a}-{b}")
+        edges.append(f"start-{rng.choice(big)}")
+        edges.append(f"start-{rng.choice(small)}")
+        edges.append(f"{rng.choice(big)}-end")
+        edges.append(f"{rng.choice(small)}-end")
+
+    rng.shuffle(edges)
+    return edges
@@ -131,9 +131,6 @@ def part_1(input_lines: list[str]):
     start = Node("start")
     paths = bfs(start, [[start]], graph)
 
-    for p in paths:
-        print(p)
-
     return len(paths)
 
 
@@ -0,0 +1,29 @@
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    count = 800 * scale
+
+    # unfold from the final 40x6 code until the paper is as sparse as the puzzle
+    width, height = 40, 6
+    folds = []
+    while width * height < count * 1400:
+        if len(folds) % 2 == 0:
+            folds.append(f"fold along x={width}")
+            width = width * 2 + 1
+        else:
+            folds.append(f"fold along y={height}")
+            height = height * 2 + 1
+    folds.reverse()
+
+    x_folds = {int(f.split("=")[1]) for f in folds if "x=" in f}
+    y_folds = {int(f.split("=")[1]) for f in folds if "y=" in f}
+    x_valid = [x for x in range(width) if x not in x_folds]
+    y_valid = [y for y in range(height) if y not in y_folds]
+
+    dots: set[tuple[int, int]] = set()
+    while len(dots) < count:
+        dots.add((rng.choice(x_valid), rng.choice(y_valid)))
+
+    return [f"{x},{y}" for x, y in dots] + [""] + folds
@@ -1,21 +1,8 @@
 from dataclasses import dataclass
+from pathlib import Path
 
-
-@dataclass
-class Vector:
-    x: int
-    y: int
-
-    def __eq__(self, __o: object) -> bool:
-        if isinstance(__o, Vector):
-            return self.x == __o.x and self.y == __o.y
-        return False
-
-    def __repr__(self) -> str:
-        return f"({self.x}, {self.y})"
-
-    def __hash__(self) -> int:
-        return hash(f"{self.x},{self.y}")
+from aoc.cache import parsed
+from aoc.points import Vector
 
 
 @dataclass
@@ -72,6 +59,7 @@ def parse_fold(fold: str) -> Fold:
     return Fold(direction, index)
 
 
+@parsed
 def parse_input(input_lines: list[str]) -> tuple[list[Vector], list[Fold]]:
     empty_index = input_lines.index("")
     a = input_lines[:empty_index]
@@ -140,6 +128,6 @@ def part_2(input_lines: list[str]):
 
 
 if __name__ == "__main__":
-    inp = read_file("input.txt")
+    inp = read_file(Path(__file__).parent / "input.txt")
     out = part_2(inp)
     print(out)
@@ -0,0 +1,18 @@
+import random
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    template = "".join(rng.choice(ELEMENTS) for _ in range(20 * scale))
+
+    # every pair needs a rule and every element needs to be produced by one
+    pairs = [a + b for a in ELEMENTS for b in ELEMENTS]
+    outputs = list(ELEMENTS) * (len(pairs) // len(ELEMENTS))
+    rng.shuffle(outputs)
+    rules = [f"{pair} -> {element}" for pair, element in zip(pairs, outputs)]
+    rng.shuffle(rules)
+
+    return [template, ""] + rules
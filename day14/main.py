@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from aoc.cache import parsed
+
 
 @dataclass
 class Element:
@@ -114,6 +116,7 @@ def parse_rules(rules: list["str"]) -> Rules:
     return Rules({parse_line(rule)[0]: parse_line(rule)[1] for rule in rules})
 
 
+@parsed
 def parse_input(input_lines: list["str"]) -> tuple[Template, Rules]:
     template = parse_template(input_lines[0])
     rules = parse_rules(input_lines[2:])
@@ -161,9 +164,8 @@ def take_step2(template: Template, rules: Rules) -> Template:
 def part_1(input_lines: list[str]):
     template, rules = parse_input(input_lines)
 
-    for i in range(10):
+    for _ in range(10):
         template = take_step(template, rules)
-        print(i)
 
     return template.most_common_qty - template.least_common_qty
 
@@ -180,7 +182,6 @@ def part_2(input_lines: list[str]):
         elements[a] += 1 * qty
         elements[b] += 1 * qty
 
-    print(elements)
     most = max(v for v in elements.values())
     least = min(v for v in elements.values())
 
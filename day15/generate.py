@@ -0,0 +1,10 @@
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    size = int(100 * math.sqrt(scale))
+    return [
+        "".join(str(rng.randint(1, 9)) for _ in range(size)) for _ in range(size)
+    ]
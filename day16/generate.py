@@ -0,0 +1,42 @@
+import math
+import random
+
+
+def literal(rng: random.Random) -> str:
+    value = rng.randrange(1 << rng.choice([4, 8, 12, 16, 32]))
+    digits = f"{value:b}"
+    digits = digits.zfill(-(-len(digits) // 4) * 4)
+    groups = [digits[i : i + 4] for i in range(0, len(digits), 4)]
+    flags = ["1"] * (len(groups) - 1) + ["0"]
+    body = "".join(f + g for f, g in zip(flags, groups))
+    return f"{rng.randrange(8):03b}100{body}"
+
+
+def operator(rng: random.Random, type_id: int, children: list[str]) -> str:
+    bits = "".join(children)
+    header = f"{rng.randrange(8):03b}{type_id:03b}"
+    if len(bits) < 1 << 15 and rng.random() < 0.5:
+        return f"{header}0{len(bits):015b}{bits}"
+    return f"{header}1{len(children):011b}{bits}"
+
+
+def packet(rng: random.Random, budget: int, root: bool = False) -> str:
+    if budget <= 1 and not root:
+        return literal(rng)
+
+    if budget <= 3:
+        type_id = rng.choice([5, 6, 7])
+        return operator(rng, type_id, [packet(rng, 1), packet(rng, 1)])
+
+    type_id = rng.choice([0, 1, 2, 3]) if budget <= 16 else rng.choice([0, 2, 3])
+    count = rng.randint(2, int(math.sqrt(budget)) + 2)
+    sizes = [max(1, (budget - 1) // count + rng.randint(-1, 1)) for _ in range(count)]
+    return operator(rng, type_id, [packet(rng, s) for s in sizes])
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    bits = packet(rng, 250 * scale, root=True)
+    bits += "0" * (-len(bits) % 4)
+    return [f"{int(bits, 2):0{len(bits) // 4}X}"]
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 import math
 
+from aoc.cache import parsed
+
 
 def parse_hexa(hexa: str) -> str:
     return bin(int(hexa, 16))[2:].zfill(4)
 
 
+@parsed
 def parse_input(line: str) -> str:
     return "".join([parse_hexa(c) for c in line])
 
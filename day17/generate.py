@@ -0,0 +1,13 @@
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    factor = math.sqrt(scale)
+
+    x1 = int(rng.randint(150, 300) * factor)
+    x2 = x1 + int(rng.randint(20, 60) * factor)
+    y1 = -int(rng.randint(80, 160) * factor)
+    y2 = y1 + int(rng.randint(20, 50) * factor)
+    return [f"target area: x={x1}..{x2}, y={y1}..{y2}"]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.points import Vector
 
 
 def read_file(path) -> list[str]:
@@ -7,47 +10,6 @@ def read_file(path) -> list[str]:
         return file.read().splitlines()
 
 
-@dataclass
-class Vector:
-    x: int
-    y: int
-
-    def __add__(self, __o) -> Vector:
-        if isinstance(__o, Vector):
-            x = self.x + __o.x
-            y = self.y + __o.y
-            return Vector(x, y)
-        raise Exception(TypeError)
-
-    def __iadd__(self, __o) -> Vector:
-        if isinstance(__o, Vector):
-            x = self.x + __o.x
-            y = self.y + __o.y
-            return Vector(x, y)
-        raise Exception(TypeError)
-
-    def __eq__(self, __o: object) -> bool:
-        if isinstance(__o, Vector):
-            return self.x == __o.x and self.y == __o.y
-        return False
-
-    def __le__(self, __o: object) -> bool:
-        if isinstance(__o, Vector):
-            return self.x <= __o.x and self.y <= __o.y
-        return False
-
-    def __ge__(self, __o: object) -> bool:
-        if isinstance(__o, Vector):
-            return self.x >= __o.x and self.y >= __o.y
-        return False
-
-    def __repr__(self) -> str:
-        return f"({self.x}, {self.y})"
-
-    def __hash__(self) -> int:
-        return hash(f"{self.x}{self.y}")
-
-
 @dataclass
 class Target:
     start: Vector
@@ -70,7 +32,8 @@ class Target:
         return max(self.start.y, self.end.y)
 
     def hit(self, pos: Vector) -> bool:
-        return self.start <= pos <= self.end
+        x_hit = self.start.x <= pos.x <= self.end.x
+        return x_hit and self.start.y <= pos.y <= self.end.y
 
 
 def parse_input(input: str) -> Target:
@@ -223,7 +186,7 @@ if __name__ == "__main__":
     sample = 0
     part = 2
 
-    path = "sample.txt" if sample else "input.txt"
+    path = Path(__file__).parent / ("sample.txt" if sample else "input.txt")
     inp = read_file(path)
 
     if part == 1:
@@ -0,0 +1,16 @@
+import random
+
+
+def snail_number(rng: random.Random, depth: int = 1) -> str:
+    pair = []
+    for _ in range(2):
+        if depth < 4 and rng.random() < 0.6:
+            pair.append(snail_number(rng, depth + 1))
+        else:
+            pair.append(str(rng.randrange(10)))
+    return f"[{pair[0]},{pair[1]}]"
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [snail_number(rng) for _ in range(100 * scale)]
@@ -176,7 +176,6 @@ def part_1(input_lines: list[str]):
     snl = input_lines
 
     sn = reduce(lambda a, b: calc(a, b), snl)
-    print(sn)
 
     return magnitude(sn)  # type: ignore
 
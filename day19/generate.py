@@ -0,0 +1,121 @@
+from itertools import permutations, product
+import random
+
+Vector = tuple[int, int, int]
+Matrix = tuple[Vector, Vector, Vector]
+
+RANGE = 1000
+
+
+def determinant(m: Matrix) -> int:
+    a, b, c = m
+    return (
+        a[0] * (b[1] * c[2] - b[2] * c[1])
+        - a[1] * (b[0] * c[2] - b[2] * c[0])
+        + a[2] * (b[0] * c[1] - b[1] * c[0])
+    )
+
+
+def rotations() -> list[Matrix]:
+    out = []
+    for axes in permutations(range(3)):
+        for signs in product([1, -1], repeat=3):
+            m = tuple(
+                tuple(signs[i] if j == axes[i] else 0 for j in range(3))
+                for i in range(3)
+            )
+            if determinant(m) == 1:  # type: ignore
+                out.append(m)
+    return out  # type: ignore
+
+
+def rotate(m: Matrix, v: Vector) -> Vector:
+    return tuple(sum(m[i][j] * v[j] for j in range(3)) for i in range(3))  # type: ignore
+
+
+def sees(scanner: Vector, beacon: Vector) -> bool:
+    return all(abs(b - s) <= RANGE for s, b in zip(scanner, beacon))
+
+
+def random_point(rng: random.Random, low: Vector, high: Vector) -> Vector:
+    return tuple(rng.randint(a, b) for a, b in zip(low, high))  # type: ignore
+
+
+def overlaps(a: Vector, b: Vector) -> bool:
+    # some point is within range of both scanners
+    return all(abs(x - y) < 2 * RANGE for x, y in zip(a, b))
+
+
+def cell(point: Vector) -> Vector:
+    return tuple(c // (2 * RANGE) for c in point)  # type: ignore
+
+
+def crowded(grid: dict[Vector, list[Vector]], scanner: Vector, parent: Vector) -> bool:
+    for offset in product([-1, 0, 1], repeat=3):
+        near = tuple(c + o for c, o in zip(cell(scanner), offset))
+        for other in grid.get(near, []):  # type: ignore
+            if other != parent and overlaps(scanner, other):
+                return True
+    return False
+
+
+def generate(scale: int = 1, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    scanners: list[Vector] = [(0, 0, 0)]
+    grid: dict[Vector, list[Vector]] = {cell((0, 0, 0)): [(0, 0, 0)]}
+    beacons: set[Vector] = set()
+    for _ in range(4):
+        beacons.add(random_point(rng, (-RANGE,) * 3, (RANGE,) * 3))  # type: ignore
+
+    # every new scanner shares 12 beacons with the one it branches from and
+    # sees no other scanner's range, so like the puzzle each reports 12 per
+    # neighbour plus a few of its own, about 26 in all
+    while len(scanners) < 36 * scale:
+        parent = rng.choice(scanners)
+        offset = [rng.choice([-1, 1]) * rng.randint(600, 1200) for _ in range(3)]
+        scanner: Vector = tuple(p + o for p, o in zip(parent, offset))  # type: ignore
+        if crowded(grid, scanner, parent):
+            continue
+
+        low = tuple(max(p, s) - RANGE for p, s in zip(parent, scanner))
+        high = tuple(min(p, s) + RANGE for p, s in zip(parent, scanner))
+        shared: set[Vector] = set()
+        while len(shared) < 12:
+            shared.add(random_point(rng, low, high))  # type: ignore
+        beacons |= shared
+
+        low = tuple(s - RANGE for s in scanner)
+        high = tuple(s + RANGE for s in scanner)
+        own = rng.randint(1, 4)
+        while own:
+            beacon = random_point(rng, low, high)  # type: ignore
+            if not sees(parent, beacon):
+                beacons.add(beacon)
+                own -= 1
+
+        scanners.append(scanner)
+        grid.setdefault(cell(scanner), []).append(scanner)
+
+    # bucket the beacons so every scanner only checks its own neighbourhood
+    buckets: dict[Vector, list[Vector]] = {}
+    for beacon in beacons:
+        buckets.setdefault(tuple(c // RANGE for c in beacon), []).append(beacon)  # type: ignore
+
+    orientations = rotations()
+    lines: list[str] = []
+    for n, scanner in enumerate(scanners):
+        m = orientations[0] if n == 0 else rng.choice(orientations)
+        if lines:
+            lines.append("")
+        lines.append(f"--- scanner {n} ---")
+        here = tuple(c // RANGE for c in scanner)
+        for offset in product([-1, 0, 1], repeat=3):
+            near = tuple(c + o for c, o in zip(here, offset))
+            for beacon in buckets.get(near, []):  # type: ignore
+                if not sees(scanner, beacon):
+                    continue
+                local = tuple(b - s for b, s in zip(beacon, scanner))
+                x, y, z = rotate(m, local)  # type: ignore
+                lines.append(f"{x},{y},{z}")
+    return lines
@@ -1,6 +1,11 @@
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+
+from aoc.cache import parsed
+from aoc.points import Vector3
 
 
 class Rotation(Enum):
@@ -25,47 +30,6 @@ class Orientation:
     facing: Facing
 
 
-@dataclass(slots=True)
-class Vector3:
-    x: int
-    y: int
-    z: int
-
-    def __repr__(self) -> str:
-        return f"({self.x}, {self.y}, {self.z})"
-
-    def __add__(self, __o: object) -> Vector3:
-        if not isinstance(__o, Vector3):
-            raise Exception(TypeError)
-        x = self.x + __o.x
-        y = self.y + __o.y
-        z = self.z + __o.z
-        return Vector3(x, y, z)
-
-    def __sub__(self, __o: object) -> Vector3:
-        if not isinstance(__o, Vector3):
-            raise Exception(TypeError)
-        x = self.x - __o.x
-        y = self.y - __o.y
-        z = self.z - __o.z
-        return Vector3(x, y, z)
-
-    def __eq__(self, __o: object) -> bool:
-        if isinstance(__o, Vector3):
-            return self.x == __o.x and self.y == __o.y and self.z == __o.z
-        return False
-
-    def __gt__(self, __o: object) -> bool:
-        if isinstance(__o, Vector3):
-            a_dist = abs(self.x) + abs(self.y) + abs(self.z)
-            b_dist = abs(__o.x) + abs(__o.y) + abs(__o.z)
-            return a_dist > b_dist
-        return False
-
-    def __hash__(self) -> int:
-        return hash(f"{self.x}{self.y}{self.z}")
-
-
 @dataclass(slots=True)
 class Scanner:
     beacons: set[Vector3]
@@ -92,18 +56,23 @@ def parse_beacon(line: str) -> Vector3:
     return Vector3(x, y, z)
 
 
-def parse_scanners(lines: list[str]) -> list[Scanner]:
-
-    breaks = [i for i, j in enumerate(lines) if j == ""]
+@parsed
+def parse_coordinates(lines: list[str]) -> list[array]:
+    # x, y, z of every beacon, flat per scanner: cheap to pickle and to load,
+    # where unpickling thousands of Vector3 costs about as much as parsing
+    coordinates = []
+    for scanner in "\n".join(lines).split("\n\n"):
+        if scanner.strip():
+            beacons = ",".join(scanner.strip().splitlines()[1:])
+            coordinates.append(array("l", map(int, filter(None, beacons.split(",")))))
+    return coordinates
 
-    s = 1
-    ranges = []
-    for b in breaks + [len(lines)]:
-        ranges.append((s, b))
-        s = b + 2
 
-    scanners = [lines[i:j] for (i, j) in ranges]
-    return [Scanner({parse_beacon(b) for b in s}) for s in scanners]
+def parse_scanners(lines: list[str]) -> list[Scanner]:
+    scanners = []
+    for c in parse_coordinates(lines):
+        scanners.append(Scanner({Vector3(*b) for b in zip(c[::3], c[1::3], c[2::3])}))
+    return scanners
 
 
 def normalize_rotation(pos: Vector3, rotation: Rotation) -> Vector3:
@@ -240,12 +209,12 @@ def part_2(input_lines: list[str]):
     # for p in positions:
     #     print(p)
 
-    distance = Vector3(0, 0, 0)
+    distance = 0
     for p in positions:
         for n in positions:
-            distance = max(p - n, distance)
+            distance = max((p - n).manhattan, distance)
 
-    return abs(distance.x) + abs(distance.y) + abs(distance.z)
+    return distance
 
 
 if __name__ == "__main__":
@@ -253,7 +222,7 @@ if __name__ == "__main__":
     sample = 0
     part = 2
 
-    path = "sample.txt" if sample else "input.txt"
+    path = Path(__file__).parent / ("sample.txt" if sample else "input.txt")
     inp = read_file(path)
 
     if part == 1:
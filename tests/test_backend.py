@@ -0,0 +1,36 @@
+import pytest
+
+from aoc import backend, cache, generate, runner, verify
+
+pytestmark = pytest.mark.skipif(backend.np is None, reason="numpy is not installed")
+
+DAYS = [day for day in runner.available_days() if verify.uses_backend(day)]
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(cache, "ENABLED", False)
+
+
+def answers(day: int, part: int, path) -> dict[str, object]:
+    results = {}
+    for name in backend.BACKENDS:
+        with backend.using(name):
+            result = runner.run_part(day, part, path)
+        results[name] = result.error or result.answer
+    return results
+
+
+@pytest.mark.parametrize("part", [1, 2])
+@pytest.mark.parametrize("day", DAYS)
+def test_sample(day, part):
+    numpy, python = answers(day, part, runner.input_path(day, sample=True)).values()
+    assert numpy == python
+
+
+@pytest.mark.parametrize("part", [1, 2])
+@pytest.mark.parametrize("day", DAYS)
+def test_generated(day, part):
+    path = generate.generated_input(day, 1, seed=0)
+    numpy, python = answers(day, part, path).values()
+    assert numpy == python
@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from aoc import backend
+from day01.main import count_file, count_increases
+
+
+def readings(seed: int) -> list[int]:
+    # small values so equal neighbours (not an increase) come up too
+    rng = random.Random(seed)
+    step = rng.choice([1, 97])
+    return [rng.randrange(1, 1000, step) for _ in range(rng.randint(1, 40))]
+
+
+# a few bytes per chunk, so windows span several chunks and many chunks start
+# or end mid-line
+@pytest.mark.parametrize("name", backend.available())
+@pytest.mark.parametrize("trailing", [True, False])
+@pytest.mark.parametrize("chunk", [1, 3, 8])
+@pytest.mark.parametrize("window", [1, 3, 10])
+def test_count_file_matches_count_increases(tmp_path, name, trailing, chunk, window):
+    path = tmp_path / "input.txt"
+    for seed in range(20):
+        values = readings(seed)
+        path.write_text("\n".join(map(str, values)) + ("\n" if trailing else ""))
+        with backend.using(name):
+            counted = count_file(path, window, workers=1, chunk=chunk)
+        assert counted == count_increases(values, window)
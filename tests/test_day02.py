@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from day02.main import COMMANDS, Trajectory, reduce_commands, reduce_file
+
+
+def commands(seed: int, count: int | None = None) -> list[tuple[str, int]]:
+    rng = random.Random(seed)
+    count = rng.randint(1, 30) if count is None else count
+    return [(rng.choice(COMMANDS), rng.randint(1, 9)) for _ in range(count)]
+
+
+def lines(commands: list[tuple[str, int]]) -> list[str]:
+    return [f"{i} {n}" for i, n in commands]
+
+
+# chunks shorter than a line, so most start and end inside one
+@pytest.mark.parametrize("trailing", [True, False])
+@pytest.mark.parametrize("chunk", [1, 5, 16, 64])
+def test_reduce_file_matches_reduce_commands(tmp_path, trailing, chunk):
+    path = tmp_path / "input.txt"
+    for seed in range(20):
+        cmds = commands(seed)
+        path.write_text("\n".join(lines(cmds)) + ("\n" if trailing else ""))
+        assert reduce_file(path, workers=1, chunk=chunk) == reduce_commands(cmds)
+
+
+def with_blanks(lines: list[str], seed: int) -> str:
+    # blank and whitespace-only lines anywhere, including first and last
+    rng = random.Random(seed)
+    out = []
+    for line in lines + [""]:
+        out += rng.choice([[], [], [""], ["  "], ["", ""]])
+        out.append(line)
+    return "\n".join(out)
+
+
+# short runs, and one crossing a few 1024-command checkpoints
+RUNS = [commands(seed) for seed in range(10)] + [commands(10, 2100)]
+
+
+@pytest.mark.parametrize("every", [1, 3, 1024])
+@pytest.mark.parametrize("cmds", RUNS, ids=lambda cmds: f"{len(cmds)}")
+def test_trajectory_matches_reduce_commands(tmp_path, every, cmds):
+    path = tmp_path / "input.txt"
+    path.write_text(with_blanks(lines(cmds), len(cmds)))
+    expected = [reduce_commands(cmds[:k]) for k in range(len(cmds) + 1)]
+
+    for trajectory in (
+        Trajectory.from_commands(cmds, every),
+        Trajectory.from_file(path, every),
+    ):
+        assert trajectory.length == len(cmds)
+        assert [trajectory.at(k) for k in range(len(cmds) + 1)] == expected
+        with pytest.raises(IndexError):
+            trajectory.at(len(cmds) + 1)
@@ -0,0 +1,24 @@
+import pytest
+
+from aoc import runner
+from day04.generate import generate
+from day04.main import Bingo, Boards, Draws, read_file, win_ranking
+
+
+INPUTS = [read_file(runner.input_path(4, sample=True))]
+INPUTS += [generate(scale=1, seed=seed) for seed in range(3)]
+
+
+@pytest.mark.parametrize("lines", INPUTS)
+def test_bingo_matches_win_ranking(lines):
+    # drawing one number at a time has to find the boards the closed form
+    # ranks, in the same order and with the same scores
+    draws = Draws(lines[0]).draws
+    boards = Boards(lines[2:])
+    bingo = Bingo(boards)
+    played = [
+        (board, bingo.final_score(board, number))
+        for number in draws
+        for board in bingo.draw(number)
+    ]
+    assert played == [(w.board, w.score) for w in win_ranking(draws, boards)]
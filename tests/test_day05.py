@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from aoc import backend
+from day05.main import SurfaceMap
+
+
+def segment(rng: random.Random, size: int) -> str:
+    # few distinct keys per family, so collinear runs overlap often
+    kind = rng.choice(["vertical", "horizontal", "descending", "ascending"])
+    a, b = rng.randrange(size), rng.randrange(size)
+    if kind == "vertical":
+        x1 = x2 = rng.randrange(4)
+        y1, y2 = a, b
+    elif kind == "horizontal":
+        y1 = y2 = rng.randrange(4)
+        x1, x2 = a, b
+    elif kind == "descending":
+        x1, x2 = sorted((a, b))
+        y1, y2 = x1, x2
+        shift = rng.randrange(-2, 3)
+        x1, x2 = x1 + max(shift, 0), x2 + max(shift, 0)
+        y1, y2 = y1 + max(-shift, 0), y2 + max(-shift, 0)
+    else:
+        x1, x2 = sorted((a, b))
+        key = size - 1 + rng.randrange(-2, 3)
+        y1, y2 = key - x1, key - x2
+        if min(y1, y2) < 0:
+            y1, y2 = y1 + size, y2 + size
+    if rng.random() < 0.5:
+        x1, y1, x2, y2 = x2, y2, x1, y1
+    return f"{x1},{y1} -> {x2},{y2}"
+
+
+def random_maps(count: int) -> list[list[str]]:
+    rng = random.Random(2021)
+    return [
+        [segment(rng, rng.choice([3, 6, 12])) for _ in range(rng.randint(1, 14))]
+        for _ in range(count)
+    ]
+
+
+CASES = [
+    # diagonals meeting on a cell (x - y and x + y of the same parity)
+    ["0,0 -> 4,4", "0,4 -> 4,0"],
+    # and crossing between cells, which is no intersection
+    ["0,0 -> 4,4", "0,5 -> 5,0"],
+    # collinear overlaps, touching ends and a single-cell line
+    ["0,2 -> 5,2", "3,2 -> 8,2", "8,2 -> 9,2", "4,0 -> 4,4", "4,2 -> 4,2"],
+    ["1,1 -> 5,5", "6,6 -> 3,3", "0,6 -> 6,0", "2,4 -> 4,2"],
+]
+
+
+def straight(line: str) -> bool:
+    (x1, y1), (x2, y2) = (end.split(",") for end in line.split(" -> "))
+    return x1 == x2 or y1 == y2
+
+
+# maps without straight lines have nothing to count when diagonals are off
+MAPS = [
+    (lines, diagonal)
+    for lines in CASES + random_maps(300)
+    for diagonal in (False, True)
+    if diagonal or any(map(straight, lines))
+]
+
+
+@pytest.mark.parametrize("lines, diagonal", MAPS)
+def test_sweep_matches_rasterized(lines, diagonal):
+    surface_map = SurfaceMap(lines, diagonal)
+    expected = surface_map.dense_intersections
+    assert surface_map.swept_intersections == expected
+    assert surface_map.flat_intersections == expected
+    for name in backend.available():
+        with backend.using(name):
+            assert surface_map.sparse_intersections == expected
+            assert surface_map.intersections == expected
+
+
+def test_cases_count():
+    assert SurfaceMap(CASES[0], True).swept_intersections == 1
+    assert SurfaceMap(CASES[1], True).swept_intersections == 0
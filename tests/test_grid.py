@@ -0,0 +1,25 @@
+import pytest
+
+from aoc import grid
+from aoc.grid import Grid
+
+
+def test_from_digits():
+    g = Grid.from_digits(["012", "345"])
+    assert (g.width, g.height, list(g.cells)) == (3, 2, [0, 1, 2, 3, 4, 5])
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [["garbage"], ["12", "3a"], ["12 ", "345"], ["123", "45"], ["12", ""], [], ["1²"]],
+)
+def test_from_digits_rejects(lines):
+    with pytest.raises(ValueError):
+        Grid.from_digits(lines)
+
+
+def test_neighbor_tables_bounded():
+    grid.neighbor_table.cache_clear()
+    for width in range(1, 3 * grid.TABLES):
+        Grid.filled(width, 2).neighbors4(0)
+    assert grid.neighbor_table.cache_info().currsize == grid.TABLES